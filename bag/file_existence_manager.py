@@ -159,7 +159,7 @@ def populate_db(
     """Create/update database at ``path`` by hashing files in ``directory``."""
     store = GdbmStorageStrategy(path=path)
     m = FileExistenceManager(store)
-    for p in Path(directory).walk():
+    for p in Path(directory).traverse():
         if not p.is_file():
             continue
         with open(str(p), "rb") as stream:
@@ -186,7 +186,7 @@ def check_dups(
     """
     store = GdbmStorageStrategy(path=path)
     m = FileExistenceManager(store)
-    for p in Path(directory).walk():
+    for p in Path(directory).traverse():
         if not p.is_file():
             continue
         with open(str(p), "rb") as stream:
@@ -222,7 +222,7 @@ def find_dups(
     store = GdbmStorageStrategy(path=path)
     m = FileExistenceManager(store)
     dups = {}
-    for p in Path(directory).walk():
+    for p in Path(directory).traverse():
         if not p.is_file():
             continue
         with open(str(p), "rb") as stream:
@@ -3,6 +3,16 @@
 import re
 from html.entities import name2codepoint
 
+# The most frequent named entities, checked before the general table
+_HOT_ENTITIES = {
+    "amp": "&",
+    "lt": "<",
+    "gt": ">",
+    "quot": '"',
+    "nbsp": "\xa0",
+    "apos": "'",
+}
+
 
 def encode_xml_char_refs(s):
     # http://mail.python.org/pipermail/python-list/2007-January/424262.html
@@ -17,6 +27,9 @@ def _substitute_entity(match):
         elif match.group(2) == "x":  # number is hex
             return chr(int("0x" + ent, 16))
     else:
+        hot = _HOT_ENTITIES.get(ent)
+        if hot is not None:
+            return hot
         cp = name2codepoint.get(ent)  # decode by name
         if cp:
             return chr(cp)
@@ -31,16 +44,14 @@ def decode_entities(txt):
 entity_re = re.compile(r"&(#?)(x?)(\w+);", flags=re.IGNORECASE)
 
 
+_BREAKS_AND_WHITESPACE = re.compile(r"<br\s*/?>|[\r\n\t]")
+_MULTISPACE = re.compile(r" {2,}")
+
+
+def _substitute_break(match):
+    return "\n" if match.group()[0] == "<" else " "
+
+
 def html_to_unicode(html):
-    html = (
-        decode_entities(html)
-        .replace("\r\n", " ")
-        .replace("\r", " ")
-        .replace("\n", " ")
-        .replace("\t", " ")
-        .replace("<br />", "\n")
-        .replace("<br>", "\n")
-        .strip()
-    )
-    regex = re.compile(r" {2,999}")
-    return regex.sub(" ", html)
+    html = _BREAKS_AND_WHITESPACE.sub(_substitute_break, decode_entities(html))
+    return _MULTISPACE.sub(" ", html.strip())
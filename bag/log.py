@@ -32,6 +32,10 @@ def setup_log(
 
     If ``rotating`` is False, a single log file will be created at ``path``.
     Its ``file_mode`` defaults to `a` (append), but you can set it to `w`.
+
+    If this function has already configured the logger, it is returned
+    unchanged, so calling it again does not duplicate output. Handlers
+    added by others (e.g. ``logging.basicConfig()``) do not count.
     """
     # If strings are passed in as levels, "decode" them first
     levels = dict(
@@ -49,25 +53,27 @@ def setup_log(
         screen_level = levels[screen_level.lower()]
     # Set up logging
     log = logging.getLogger(name)
+    if any(getattr(h, "_from_setup_log", False) for h in log.handlers):
+        return log
     if screen_level:
         h1 = logging.StreamHandler()
         h1.setLevel(screen_level)
+        h1._from_setup_log = True
         log.addHandler(h1)
     if disk_level:
         if rotating:
-            try:
-                os.mkdir(path)
-            except OSError:
-                pass
+            os.makedirs(path, exist_ok=True)
             h2 = RotatingFileHandler(
                 os.path.join(path, name or "root" + ".log.txt"),
                 encoding=encoding,
                 maxBytes=2 ** 22,
                 backupCount=backups,
+                delay=True,
             )
         else:
             h2 = WatchedFileHandler(path, mode=file_mode, encoding=encoding)
         h2.setLevel(disk_level)
+        h2._from_setup_log = True
         log.setLevel(disk_level)
         log.addHandler(h2)
     return log
@@ -10,9 +10,17 @@ def monkeypatch(cls: type, name: str = ""):
         def some_method(self):
             pass
     """
+    if name:
+
+        def _monkeypatch_named(fn):
+            setattr(cls, name, fn)
+            return fn
+
+        return _monkeypatch_named
 
     def _monkeypatch(fn):
-        nam = name or (fn.fget.__name__ if isinstance(fn, property) else fn.__name__)
+        nam = fn.fget.__name__ if isinstance(fn, property) else fn.__name__
         setattr(cls, nam, fn)
+        return fn
 
     return _monkeypatch
@@ -1,4 +1,6 @@
 # noqa
+import shutil
+
 import requests  # pip install requests
 
 
@@ -6,9 +8,24 @@ def retrieve_payload(source: str) -> bytes:
     """Given a URL or a local filesystem path, return its contents as bytes."""
     if source.startswith(("http://", "https://")):
         response = requests.get(source)
-        assert response.status_code == 200, f"Unable to retrieve: {source}"
-        assert isinstance(response.content, bytes), f"Content not bytes: {source}"
+        response.raise_for_status()
         return response.content
     else:
         with open(source, mode="rb") as stream:
             return stream.read()
+
+
+def retrieve_payload_to(source: str, path: str, chunk_size: int = 2**20) -> None:
+    """Given a URL or a local filesystem path, save its contents to ``path``.
+
+    Unlike ``retrieve_payload()``, the content never sits in memory as a
+    whole: HTTP responses are streamed to disk ``chunk_size`` bytes at a time.
+    """
+    if source.startswith(("http://", "https://")):
+        with requests.get(source, stream=True) as response:
+            response.raise_for_status()
+            with open(path, mode="wb") as stream:
+                for chunk in response.iter_content(chunk_size=chunk_size):
+                    stream.write(chunk)
+    else:
+        shutil.copyfile(source, path)
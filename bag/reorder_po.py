@@ -18,7 +18,7 @@ from polib import pofile
 def reorder_po(path, encoding="utf-8"):
     p = Path(path)
     if p.is_dir():
-        for path in p.glob("**.po"):
+        for path in p.rglob("*.po"):
             _reorder_one(str(path), encoding=encoding)
     else:
         _reorder_one(str(path), encoding=encoding)
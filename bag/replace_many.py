@@ -6,43 +6,145 @@ Usage::
     replace_many -d DIRECTORY '.py,.jinja2' 'text being sought' 'replacement text'
 """
 
+from concurrent.futures import ThreadPoolExecutor
+import mmap
+import os
+import re
+from typing import Callable, List, Sequence, Set, Tuple
+
 from argh import ArghParser, arg
 
 from bag.pathlib_complement import Path
 
+# Files at least this large are searched via mmap before being read
+MMAP_THRESHOLD = 2**20
+
 
 @arg("extensions", help="Comma-separated file extensions to search")
 @arg("text", help="The text being sought")
 @arg("replace", help="The replacement text")
 @arg("--dir", help="Directory to be walked")
+@arg("--workers", help="Number of threads processing files concurrently")
 def replace_many(
     extensions: str,
     text: str,
     replace: str,
     dir: str = ".",
+    workers: int = 1,
 ):
     """Replace text in multiple files."""
+    replace_many_multi(extensions, [(text, replace)], dir=dir, workers=workers)
+
+
+def replace_many_multi(
+    extensions: str,
+    pairs: Sequence[Tuple[str, str]],
+    dir: str = ".",
+    workers: int = 1,
+):
+    """Perform several replacements in multiple files, in one pass per file.
+
+    ``pairs`` is a sequence of ``(text, replacement)`` tuples. When more
+    than one text is sought, a single precompiled regular expression finds
+    them all in one scan; where texts overlap, the longest one wins.
+    """
     directory = Path(dir).resolve()
     assert directory.is_dir(), "*dir* must be a directory, not a file."
-    exts = tuple((e.strip() for e in extensions.split(",")))
+    exts = {e.strip().lstrip(".").lower() for e in extensions.split(",")}
+    paths = list(_find_files(str(directory), exts))
+    needles = [text.encode("utf-8") for text, _ in pairs]
+    substitute = _make_substitute(pairs)
+
+    def process(path):
+        return _replace_in_file(path, needles, substitute)
 
     print(f"Replacing in {directory}:")
-    for path in directory.glob("**/*.*"):  # files only (not dirs)
-        strpath = str(path)
-        if not strpath.endswith(exts):
-            continue
-        # print(f"  - {strpath[len(str(directory)):]}")
-        with open(path, "r", encoding="utf-8") as src:
-            try:
-                content = src.read()
-            except UnicodeDecodeError:
-                print(f"Error reading {path}")
-                raise
-        replaced = content.replace(text, replace)
-        if content != replaced:
-            print(f"  - {strpath[len(str(directory)):]}")
-        with open(path, "w", encoding="utf-8") as dest:
-            dest.write(replaced)
+    if workers > 1:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            changes = list(pool.map(process, paths))
+    else:
+        changes = map(process, paths)
+    for path, changed in zip(paths, changes):
+        if changed:
+            print(f"  - {path[len(str(directory)):]}")
+
+
+def _make_substitute(pairs: Sequence[Tuple[str, str]]) -> Callable[[str], str]:
+    """Return a function that performs all the replacements in ``pairs``."""
+    if len(pairs) == 1:
+        text, replacement = pairs[0]
+        return lambda content: content.replace(text, replacement)
+
+    mapping = dict(pairs)
+    regex = re.compile(
+        "|".join(re.escape(text) for text in sorted(mapping, key=len, reverse=True))
+    )
+    return lambda content: regex.sub(lambda match: mapping[match.group()], content)
+
+
+def _find_files(directory: str, exts: Set[str]):
+    """Recursively yield paths of files whose extension is in ``exts``.
+
+    ``exts`` contains lowercase extensions without the leading dot, which
+    may be compound, such as ``tar.gz``; matching is case-insensitive.
+    Uses ``os.scandir()``, so file names are tested before anything is
+    stat-ed and Path objects are never built.
+    """
+    with os.scandir(directory) as it:
+        entries = list(it)
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            yield from _find_files(entry.path, exts)
+        elif _has_extension(entry.name.lower(), exts) and entry.is_file(
+            follow_symlinks=False
+        ):
+            yield entry.path
+
+
+def _has_extension(name: str, exts: Set[str]) -> bool:
+    """Tell whether any of the dot-separated tails of ``name`` is in ``exts``."""
+    dot = name.find(".")
+    while dot != -1:
+        if name[dot + 1 :] in exts:
+            return True
+        dot = name.find(".", dot + 1)
+    return False
+
+
+def _replace_in_file(
+    path, needles: List[bytes], substitute: Callable[[str], str]
+) -> bool:
+    """Apply ``substitute`` to the file at ``path``. Return whether it changed.
+
+    The file is first searched for the encoded ``needles`` as raw bytes,
+    so files that contain none of them are neither decoded nor written
+    back. Large files are searched through ``mmap`` instead of being read
+    into memory.
+    """
+    size = os.stat(path).st_size
+    if size == 0 or size < min(len(needle) for needle in needles):
+        return False
+    with open(path, "rb") as src:
+        if size < MMAP_THRESHOLD:
+            raw = src.read()
+            if not any(needle in raw for needle in needles):
+                return False
+        else:
+            with mmap.mmap(src.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                if all(mapped.find(needle) == -1 for needle in needles):
+                    return False
+            raw = src.read()
+    try:
+        content = raw.decode("utf-8")
+    except UnicodeDecodeError:
+        print(f"Error reading {path}")
+        raise
+    replaced = substitute(content)
+    if content == replaced:
+        return False
+    with open(path, "w", encoding="utf-8", newline="") as dest:
+        dest.write(replaced)
+    return True
 
 
 def _command():
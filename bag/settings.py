@@ -1,5 +1,6 @@
 """Facilitate materialization of resources indicated in configuration."""
 
+from functools import lru_cache
 from importlib import import_module
 from types import ModuleType
 
@@ -13,6 +14,12 @@ def read_ini_files(*config_files, encoding="utf-8"):
     return settings
 
 
+@lru_cache(maxsize=256)
+def _import_module(name):
+    """Memoized ``import_module()`` for repeated resource specs."""
+    return import_module(name)
+
+
 def resolve(resource_spec):
     """Return the variable referred to in the ``resource_spec`` string.
 
@@ -24,9 +31,9 @@ def resolve(resource_spec):
         return resource_spec
     parts = resource_spec.split(":")  # arg is assumed to be a string
     if len(parts) == 1:
-        return import_module(parts[0])
+        return _import_module(parts[0])
     elif len(parts) == 2:
-        module = import_module(parts[0])
+        module = _import_module(parts[0])
         return getattr(module, parts[1])
     else:
         raise ValueError(
@@ -46,7 +53,7 @@ def resolve_path(resource_spec):
     from pathlib import Path
 
     module, var = resource_spec.split(":")  # arg is assumed to be a string
-    module = import_module(module)
+    module = _import_module(module)
     return Path(module.__path__[0], var)
 
 
@@ -85,6 +92,8 @@ class SettingsReader:
     DEPRECATED. It's better to validate configuration at startup with colander.
     """
 
+    __slots__ = ("settings",)
+
     def __init__(self, adict):
         """``adict`` should be a settings dictionary."""
         self.settings = adict
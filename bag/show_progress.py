@@ -7,18 +7,18 @@ percentage done and the time remaining. Otherwise, you can only print the
 iteration index. The output messages are configurable; here are examples::
 
     $ python -c "from bag.show_progress import *; test_percentage()"
-    7.0% done, 0:00:53 left...
-    15.0% done, 0:00:45 left...
-    23.0% done, 0:00:40 left...
-    31.0% done, 0:00:35 left...
-    39.0% done, 0:00:31 left...
-    47.0% done, 0:00:27 left...
-    55.0% done, 0:00:22 left...
-    63.0% done, 0:00:18 left...
-    71.0% done, 0:00:14 left...
-    79.0% done, 0:00:10 left...
-    87.0% done, 0:00:06 left...
-    95.0% done, 0:00:02 left...
+    7% done, 0:00:53 left...
+    15% done, 0:00:45 left...
+    23% done, 0:00:40 left...
+    31% done, 0:00:35 left...
+    39% done, 0:00:31 left...
+    47% done, 0:00:27 left...
+    55% done, 0:00:22 left...
+    63% done, 0:00:18 left...
+    71% done, 0:00:14 left...
+    79% done, 0:00:10 left...
+    87% done, 0:00:06 left...
+    95% done, 0:00:02 left...
 
     $ python -c "from bag.show_progress import *; test_progress()"
     Item #17 done. Working...
@@ -32,7 +32,13 @@ Both solutions decide when to print out a progress message based on time, not
 on the number of iterations, so updates tend to appear steadily on the screen.
 """
 
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+from time import monotonic_ns
+
+
+def _utcnow():
+    """Return the naive UTC time, like the deprecated datetime.utcnow()."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
 
 
 class ShowingProgress:
@@ -46,6 +52,8 @@ class ShowingProgress:
             process(something)
     """
 
+    __slots__ = ("iterable", "seconds", "message", "done")
+
     def __init__(
         self,
         iterable,
@@ -59,17 +67,19 @@ class ShowingProgress:
         self.done = done
 
     def __iter__(self):
-        utcnow = datetime.utcnow
-        seconds = self.seconds
-        started = printed = utcnow()
+        granularity = int(self.seconds.total_seconds() * 1e9)
+        started = printed = monotonic_ns()
+        index = 0
         for index, o in enumerate(self.iterable, 1):  # Start counting at 1
             yield index, o
-            if seconds > utcnow() - printed:
+            now = monotonic_ns()
+            if now - printed < granularity:
                 continue
             print(self.message.format(index))
-            printed = utcnow()
+            printed = now
         if self.done:
-            print(self.done.format(total=index, time=utcnow() - started))
+            elapsed = timedelta(microseconds=(monotonic_ns() - started) // 1000)
+            print(self.done.format(total=index, time=elapsed))
 
 
 class PercentageDone:
@@ -79,6 +89,19 @@ class PercentageDone:
     much output.
     """
 
+    __slots__ = (
+        "max",
+        "_granularity_ns",
+        "current",
+        "start",
+        "printed",
+        "_start_ns",
+        "_printed_ns",
+        "delta",
+        "estimate",
+        "remaining",
+    )
+
     def __init__(self, max, granularity=6):
         """Parameters:
         *max*: The number of elements that shall be processed.
@@ -88,7 +111,18 @@ class PercentageDone:
         self.max = int(max)
         self.granularity = timedelta(0, granularity)
         self.current = 0
-        self.start = self.printed = datetime.utcnow()
+        self.start = self.printed = _utcnow()
+        # The monotonic clock is what actually measures time
+        self._start_ns = self._printed_ns = monotonic_ns()
+
+    @property
+    def granularity(self):
+        """A timedelta; stored in nanoseconds, as display() compares it."""
+        return timedelta(microseconds=self._granularity_ns // 1000)
+
+    @granularity.setter
+    def granularity(self, value):
+        self._granularity_ns = value // timedelta(microseconds=1) * 1000
 
     def calc(self, val):
         """Takes *val* (the current position relative to *max* and
@@ -101,15 +135,16 @@ class PercentageDone:
 
         Returns self.remaining.
         """
-        percent = 100 * int(val) / self.max
-        if percent > self.current:
-            self.current = percent
-            self.delta = datetime.utcnow() - self.start
-            self.estimate = timedelta(0, 100 * self.delta.seconds / percent)
-            self.remaining = self.estimate - self.delta
-            if self.remaining < timedelta(0):
-                self.remaining = timedelta(0)
-            return self.remaining
+        percent = 100 * int(val) // self.max  # integer floor division
+        if percent <= self.current:
+            return None
+        self.current = percent
+        self.delta = timedelta(microseconds=(monotonic_ns() - self._start_ns) // 1000)
+        self.estimate = timedelta(0, 100 * self.delta.seconds / percent)
+        self.remaining = self.estimate - self.delta
+        if self.remaining < timedelta(0):
+            self.remaining = timedelta(0)
+        return self.remaining
 
     def display(self, val):
         """Calls self.calc() and prints the percentage done and
@@ -118,13 +153,14 @@ class PercentageDone:
         But only does so every X seconds, where X is *granularity*.
         Does nothing if the granularity has not elapsed yet.
         """
-        if self.granularity > datetime.utcnow() - self.printed:
+        if monotonic_ns() - self._printed_ns < self._granularity_ns:
             return
         remaining = self.calc(val)
         if not remaining:
             return
         print("{0}% done, {1} left...".format(self.current, str(remaining)[:7]))
-        self.printed = datetime.utcnow()
+        self._printed_ns = monotonic_ns()
+        self.printed = _utcnow()
 
 
 class ShowingPercentage(PercentageDone):
@@ -139,14 +175,20 @@ class ShowingPercentage(PercentageDone):
             process(something)
     """
 
+    __slots__ = ("iterable",)
+
     def __init__(self, iterable, max, **k):
         super(ShowingPercentage, self).__init__(max, **k)
         self.iterable = iterable
 
     def __iter__(self):
+        # Call display() at most about 1000 times; it still checks the time.
+        check_every = max(1, self.max // 1000)
+        display = self.display
         for i, o in enumerate(self.iterable):
             yield i, o
-            self.display(i)
+            if i % check_every == 0:
+                display(i)
 
 
 def test_percentage():
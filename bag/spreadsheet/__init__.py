@@ -10,11 +10,17 @@ The headers are used to map the data to a dynamically-generated class so
 The code in this __init__ module is used in the inner modules.
 """
 
+from keyword import iskeyword
+from sys import intern
+from unicodedata import normalize
+
 try:
     from bag.web.pyramid import _
 except ImportError:
     _ = str  # and i18n is disabled.
 
+_VAR_TRANS = str.maketrans(" -", "__")  # header chars that become underscores
+
 
 class MissingHeaders(Exception):  # noqa
 
@@ -56,6 +62,29 @@ class ForbiddenHeaders(Exception):  # noqa
             )
 
 
+def _lowercase_headers(headers):
+    return [h.lower() if h else None for h in headers]
+
+
+def _normalize_headers(headers, case_sensitive=False):
+    """Return the set of ``headers`` present, lowercased unless case_sensitive."""
+    if case_sensitive:
+        return set(headers)
+    return {h.lower() for h in headers if h}
+
+
+def _missing_headers(present, required_headers, case_sensitive=False):
+    if case_sensitive:
+        return [h for h in required_headers if h not in present]
+    return [h for h in required_headers if h.lower() not in present]
+
+
+def _blocked_headers(present, forbidden_headers, case_sensitive=False):
+    if case_sensitive:
+        return [h for h in forbidden_headers if h in present]
+    return [h for h in forbidden_headers if h.lower() in present]
+
+
 def raise_if_missing_required_headers(
     headers, required_headers=[], case_sensitive=False
 ):
@@ -63,12 +92,8 @@ def raise_if_missing_required_headers(
 
     Else raise MissingHeaders.
     """
-    if not case_sensitive:
-        headers = [h.lower() if h else None for h in headers]
-        missing_headers = [h for h in required_headers if h.lower() not in headers]
-    else:
-        missing_headers = [h for h in required_headers if h not in headers]
-
+    present = _normalize_headers(headers, case_sensitive)
+    missing_headers = _missing_headers(present, required_headers, case_sensitive)
     if missing_headers:
         raise MissingHeaders(missing_headers)
 
@@ -78,14 +103,32 @@ def raise_if_forbidden_headers(headers, forbidden_headers=[], case_sensitive=Fal
 
     Else raise ForbiddenHeaders.
     """
-    if not case_sensitive:
-        headers = [h.lower() if h else None for h in headers]
-        blocked_headers = [h for h in forbidden_headers if h.lower() in headers]
-    else:
-        blocked_headers = [h for h in forbidden_headers if h in headers]
+    present = _normalize_headers(headers, case_sensitive)
+    blocked_headers = _blocked_headers(present, forbidden_headers, case_sensitive)
+    if blocked_headers:
+        raise ForbiddenHeaders(blocked_headers)
+
 
+def validate_headers(
+    headers, required_headers=[], forbidden_headers=[], case_sensitive=False
+):
+    """Validate ``headers`` and return the corresponding variable names.
+
+    This does the work of ``raise_if_missing_required_headers()``,
+    ``raise_if_forbidden_headers()`` and
+    ``get_corresponding_variable_names()``, but normalizes the headers
+    only once.
+    """
+    if not case_sensitive:
+        headers = _lowercase_headers(headers)
+    present = set(headers)
+    missing_headers = _missing_headers(present, required_headers, case_sensitive)
+    if missing_headers:
+        raise MissingHeaders(missing_headers)
+    blocked_headers = _blocked_headers(present, forbidden_headers, case_sensitive)
     if blocked_headers:
         raise ForbiddenHeaders(blocked_headers)
+    return _variable_names(headers, required_headers, case_sensitive)
 
 
 def get_corresponding_variable_names(headers, required_headers, case_sensitive=False):
@@ -98,8 +141,15 @@ def get_corresponding_variable_names(headers, required_headers, case_sensitive=F
     are the result of string conversion.
     """
     if not case_sensitive:
-        headers = [h.lower() if h else None for h in headers]
-        required_headers = [h.lower() for h in required_headers]
+        headers = _lowercase_headers(headers)
+    return _variable_names(headers, required_headers, case_sensitive)
+
+
+def _variable_names(headers, required_headers, case_sensitive):
+    """Like get_corresponding_variable_names(), for normalized ``headers``."""
+    if not case_sensitive:
+        if hasattr(required_headers, "items"):
+            required_headers = {k.lower(): v for k, v in required_headers.items()}
     vars = []
     for header in headers:
         if header is None:
@@ -109,6 +159,47 @@ def get_corresponding_variable_names(headers, required_headers, case_sensitive=F
         if hasattr(required_headers, "get"):
             var = required_headers.get(header.strip())
         if not var:
-            var = header.strip().replace(" ", "_").replace("-", "_").lower()
-        vars.append(var)
+            var = header.strip().translate(_VAR_TRANS).lower()
+        # Interned names make attribute lookups on the row classes cheaper
+        vars.append(intern(var))
     return vars
+
+
+def _make_row_class(name, vars, value="vals[{i}]", doc=None, namespace=None):
+    """Return a class with a slot for each of the (non-empty) ``vars``.
+
+    Its ``__init__(self, vals)`` is generated source code that assigns
+    each slot directly from ``vals`` -- e.g. ``self.email = vals[3]`` --
+    so no loop of ``setattr()`` calls runs for every row. ``value`` is
+    the template of the expression that computes a value from index ``i``;
+    ``namespace`` holds the global names that expression may use.
+    """
+    # Only names that survive compilation unchanged are interpolated into
+    # the generated source code; Python rewrites identifiers through NFKC
+    # (``nº`` would become ``no``) and keywords are not valid attributes.
+    # Other names are set with setattr(). Names that are not identifiers
+    # at all (e.g. "phone_(home)") cannot be slots, so they go in a
+    # __dict__ and remain readable through getattr().
+    slots = [v for v in vars if v and v.isidentifier()]
+    if len(slots) < len([v for v in vars if v]):
+        slots.append("__dict__")
+    cls = type(name, (), {"__slots__": tuple(slots), "__doc__": doc})
+    lines = ["def __init__(self, vals):"]
+    for i, var in enumerate(vars):
+        if not var:
+            continue
+        expr = value.format(i=i)
+        if (
+            var.isidentifier()
+            and not iskeyword(var)
+            and normalize("NFKC", var) == var
+        ):
+            lines.append("    self.{} = {}".format(var, expr))
+        else:
+            lines.append("    setattr(self, {!r}, {})".format(var, expr))
+    if len(lines) == 1:
+        lines.append("    pass")
+    namespace = dict(namespace or {})
+    exec("\n".join(lines), namespace)
+    cls.__init__ = namespace["__init__"]
+    return cls
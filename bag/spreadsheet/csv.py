@@ -6,13 +6,14 @@ The most important things here are:
 - The :py:class:`DecodingCsvWithHeaders` class
 """
 
-from codecs import BOM_UTF8, BOM_UTF16
-import csv
-from . import (
-    get_corresponding_variable_names,
-    raise_if_missing_required_headers,
-    raise_if_forbidden_headers,
+from codecs import (
+    BOM_UTF8,
+    BOM_UTF16,
+    getincrementaldecoder,
+    getincrementalencoder,
 )
+import csv
+from . import _make_row_class, validate_headers
 
 
 def decoding(stream, encoding="utf8"):
@@ -39,34 +40,24 @@ def decoding(stream, encoding="utf8"):
         elif line.startswith(BOM_UTF16):
             encoding = "utf16"
 
-    yield line.decode(encoding)
-
-    while True:  # eventually, StopIteration is raised by *stream*
-        line = stream.readline()
-        if not line:
-            return
-        yield line.decode(encoding)
+    # An incremental decoder copes with a character split between lines.
+    decode = getincrementaldecoder(encoding)().decode
+    yield decode(line)
+    yield from map(decode, iter(stream.readline, b""))
+    rest = decode(b"", final=True)
+    if rest:
+        yield rest
 
 
 def setup_reader(stream, required_headers=[], forbidden_headers=[], **k):
     c = csv.reader(stream, **k)
+    headers = [h.strip() if isinstance(h, str) else h for h in next(c)]
+    vars = validate_headers(headers, required_headers, forbidden_headers)
 
-    def readline():
-        return c.__next__()
-
-    headers = [h.strip() if isinstance(h, str) else h for h in readline()]
-    raise_if_missing_required_headers(headers, required_headers)
-    raise_if_forbidden_headers(headers, forbidden_headers)
-    vars = get_corresponding_variable_names(headers, required_headers)
-
-    class CsvRow:
-        __slots__ = vars
-
-        def __init__(self, vals):
-            for i, h in enumerate(vars):
-                setattr(self, h, vals[i].strip())
-
-    return c, readline, vars, CsvRow
+    CsvRow = _make_row_class(
+        "CsvRow", vars, value="_strip(vals[{i}])", namespace={"_strip": str.strip}
+    )
+    return c, vars, CsvRow
 
 
 def csv_with_headers_reader(stream, required_headers=[], forbidden_headers=[], **k):
@@ -88,14 +79,10 @@ def csv_with_headers_reader(stream, required_headers=[], forbidden_headers=[], *
         for o in csv_reader:
             print(o.name, o.email, o.sex)
     """
-    c, readline, headers, CsvRow = setup_reader(
+    c, headers, CsvRow = setup_reader(
         stream, required_headers, forbidden_headers, **k
     )
-    while True:
-        try:
-            yield CsvRow(readline())
-        except StopIteration:
-            return
+    yield from map(CsvRow, c)
 
 
 def decoding_csv_with_headers(bytestream, encoding="utf8", **k):
@@ -112,13 +99,13 @@ class DecodingCsvWithHeaders:
     def __init__(self, stream, encoding=None, **k):
         if encoding:
             stream = decoding(stream, encoding)
-        self.c, self.readline, self.headers, self.CsvRow = setup_reader(stream, **k)
+        self.c, self.headers, self.CsvRow = setup_reader(stream, **k)
 
     def __iter__(self):
         return self
 
     def __next__(self):
-        return self.CsvRow(self.readline())
+        return self.CsvRow(next(self.c))
 
 
 def buffered_csv_writing(rows, encoding="utf8", headers=None, buffer_rows=50):
@@ -132,20 +119,41 @@ def buffered_csv_writing(rows, encoding="utf8", headers=None, buffer_rows=50):
         return Response(content_type='text/csv', app_iter=buffered_csv_writing(
             rows=my_generator, headers=['name', 'email'], buffer_rows=50))
     """
-    from io import StringIO
-
-    buf = StringIO()
-    writer = csv.writer(buf)
+    sink = _ListSink(encoding)
+    writer = csv.writer(sink)
     if headers:
         writer.writerow(headers)
-    for i, row in enumerate(rows):
+    parts = sink.parts  # csv.writer calls write() once per row
+    for row in rows:
         writer.writerow(row)
-        if i % buffer_rows == 0:
-            yield buf.getvalue().encode(encoding)
-            buf.truncate(0)  # But in Python 3, truncate() does not move
-            buf.seek(0)  # the file pointer, so we seek(0) explicitly.
-    yield buf.getvalue().encode(encoding)
-    buf.close()
+        if len(parts) >= buffer_rows:
+            yield sink.flush()
+    if parts:
+        yield sink.flush()
+
+
+class _ListSink:
+    """Minimal file-like object that collects written strings as bytes.
+
+    Each string is encoded as soon as it is written, so a flush only has
+    to join bytes. An incremental encoder is used so that encodings with
+    a BOM (such as utf16) emit it only once.
+    """
+
+    __slots__ = ("parts", "_encode")
+
+    def __init__(self, encoding="utf8"):
+        self.parts = []
+        self._encode = getincrementalencoder(encoding)().encode
+
+    def write(self, s):
+        self.parts.append(self._encode(s))
+
+    def flush(self):
+        """Return everything written since the last flush, as bytes."""
+        content = b"".join(self.parts)
+        self.parts.clear()
+        return content
 
 
 def pyramid_download_csv(response, file_title, rows, encoding="utf8", **k):  # noqa
@@ -9,11 +9,11 @@ try:
     from bag.web.pyramid import _
 except ImportError:
     _ = str  # and i18n is disabled.
-from . import (
-    get_corresponding_variable_names,
-    raise_if_missing_required_headers,
-    raise_if_forbidden_headers,
-)
+try:
+    from python_calamine import CalamineError, CalamineWorkbook
+except ImportError:
+    CalamineWorkbook = None  # pip install python-calamine
+from . import _make_row_class, validate_headers
 
 
 def excel_reader(
@@ -21,6 +21,7 @@ def excel_reader(
     worksheet_name=None,
     required_headers=[],
     forbidden_headers=[],
+    engine="openpyxl",
 ):
     """Read an XLSX file (from ``stream``) and yield objects.
 
@@ -42,47 +43,74 @@ def excel_reader(
             required_headers=['E-mail', 'Full Name', 'Gender'])
         for o in reader:
             print(o.full_name, o.e_mail, o.gender)
+
+    Pass ``engine="calamine"`` to parse the file with python-calamine,
+    which is several times faster than openpyxl on large files. Beware
+    that it returns numbers as floats and empty cells as empty strings.
+    If python-calamine is not installed, openpyxl is used.
     """
+    if engine == "calamine" and CalamineWorkbook is not None:
+        rows = _calamine_rows(stream, worksheet_name)
+    else:
+        rows = _openpyxl_rows(stream, worksheet_name)
+
     try:
-        wb = load_workbook(stream, data_only=True)
-    except (BadZipFile, InvalidFileException, KeyError) as e:
-        raise Problem(
-            _("That is not an XLSX file."),
-            error_title=_("Unable to read the XLSX file"),
-            error_debug=str(e),
+        headers = next(rows, None)
+        if headers is None:
+            return
+        headers = [h.strip() if isinstance(h, str) else h for h in headers]
+        vars = validate_headers(headers, required_headers, forbidden_headers)
+        SpreadsheetRow = _make_row_class(
+            "SpreadsheetRow",
+            vars,
+            doc="A view on a spreadsheet row; columns are instance variables.",
         )
+        # SpreadsheetRow reads vals[i] only for columns that have a variable
+        keep_indices = tuple(i for i, var in enumerate(vars) if var)
+        width = keep_indices[-1] + 1 if keep_indices else 0
+        for row in rows:
+            if len(row) < width:  # Sheets without dimensions yield short rows
+                row = tuple(row) + (None,) * (width - len(row))
+            yield SpreadsheetRow(row)
+    finally:
+        rows.close()
 
-    # Grab either the worksheet named "Assets", or simply the first one
-    if worksheet_name and worksheet_name in wb:
-        sheet = wb[worksheet_name]
-    else:
-        sheet = wb[wb.sheetnames[0]]
 
-    this_is_the_first_row = True
-    for row in sheet.rows:
-        if this_is_the_first_row:  # Read and validate the headers
-            this_is_the_first_row = False
-            headers = [cell.value for cell in row]
-            headers = [h.strip() if isinstance(h, str) else h for h in headers]
-            raise_if_missing_required_headers(headers, required_headers)
-            raise_if_forbidden_headers(headers, forbidden_headers)
-            vars = get_corresponding_variable_names(headers, required_headers)
-            index_of_var = {var: i for i, var in enumerate(vars)}
+def _not_xlsx(e):
+    return Problem(
+        _("That is not an XLSX file."),
+        error_title=_("Unable to read the XLSX file"),
+        error_debug=str(e),
+    )
 
-            class SpreadsheetRow:
-                """A view on a spreadsheet row.
 
-                You can access data as if they were instance variables.
-                """
+def _openpyxl_rows(stream, worksheet_name=None):
+    try:
+        wb = load_workbook(stream, data_only=True, read_only=True)
+    except (BadZipFile, InvalidFileException, KeyError) as e:
+        raise _not_xlsx(e)
 
-                __slots__ = ("__cells",)
+    try:
+        # Grab either the worksheet named "Assets", or simply the first one
+        if worksheet_name and worksheet_name in wb:
+            sheet = wb[worksheet_name]
+        else:
+            sheet = wb[wb.sheetnames[0]]
 
-                def __init__(self, cells):
-                    self.__cells = cells
+        # values_only avoids creating a cell object for every value
+        yield from sheet.iter_rows(values_only=True)
+    finally:
+        wb.close()  # A read-only workbook keeps the file open until closed.
 
-                def __getattr__(self, attr):
-                    content = self.__cells[index_of_var[attr]].value
-                    return content
 
-        else:
-            yield SpreadsheetRow(row)
+def _calamine_rows(stream, worksheet_name=None):
+    try:
+        wb = CalamineWorkbook.from_filelike(stream)
+    except CalamineError as e:
+        raise _not_xlsx(e)
+
+    if worksheet_name and worksheet_name in wb.sheet_names:
+        sheet = wb.get_sheet_by_name(worksheet_name)
+    else:
+        sheet = wb.get_sheet_by_index(0)
+    yield from sheet.iter_rows()
@@ -23,15 +23,31 @@ Usage::
     sa2 = sa.clone('sqlite://')
 """
 
+from copy import copy
 from functools import wraps
+from itertools import islice
 from types import ModuleType
+from weakref import WeakValueDictionary
 
-from sqlalchemy import create_engine, MetaData, Table
+from sqlalchemy import create_engine, inspect, MetaData, Table
+from sqlalchemy.engine import Engine, make_url
 from sqlalchemy.ext.declarative import declarative_base  # , declared_attr
 from sqlalchemy.orm import sessionmaker, scoped_session
+from sqlalchemy.pool import QueuePool
 
 __all__ = ("SAContext",)
 
+_NAMING_CONVENTION = {
+    # https://alembic.readthedocs.org/en/latest/naming.html
+    # http://docs.sqlalchemy.org/en/rel_1_0/core/constraints.html#constraint-naming-conventions
+    "ix": "ix_%(table_name)s_%(column_0_label)s",
+    "uq": "%(table_name)s_%(column_0_name)s_key",
+    "ck": "ck_%(table_name)s_%(column_0_name)s",
+    # could be: "ck": "ck_%(table_name)s_%(constraint_name)s",
+    "fk": "%(table_name)s_%(column_0_name)s_%(referred_table_name)s_fkey",
+    "pk": "%(table_name)s_pkey",
+}
+
 
 class SAContext:
     """Provide convenient and encapsulated SQLAlchemy initialization."""
@@ -40,11 +56,26 @@ class SAContext:
         "base",
         "dburi",
         "engine",
+        "metadata",
         "Session",
         "_scoped_session",
         "use_transaction",
     )
 
+    # Reuse the most recently returned connection, so idle connections
+    # can time out, and discard connections the server has dropped.
+    engine_defaults = {
+        "pool_use_lifo": True,
+        "pool_pre_ping": True,
+        "pool_recycle": 3600,
+    }
+    _engine_cache: "WeakValueDictionary[tuple, Engine]" = WeakValueDictionary()
+
+    # How the scoped session tells its scopes apart. None means thread-local
+    # storage, right for threaded servers. Under asyncio or gevent, set e.g.
+    # ``scopefunc = staticmethod(asyncio.current_task)`` in a subclass.
+    scopefunc = None
+
     def __init__(
         self,
         base=None,
@@ -59,26 +90,17 @@ class SAContext:
         self.Session = None
         self._scoped_session = None
         self.use_transaction = use_transaction
-        metadata = metadata or MetaData(
-            naming_convention={
-                # https://alembic.readthedocs.org/en/latest/naming.html
-                # http://docs.sqlalchemy.org/en/rel_1_0/core/constraints.html#constraint-naming-conventions
-                "ix": "ix_%(table_name)s_%(column_0_label)s",
-                "uq": "%(table_name)s_%(column_0_name)s_key",
-                "ck": "ck_%(table_name)s_%(column_0_name)s",
-                # could be: "ck": "ck_%(table_name)s_%(constraint_name)s",
-                "fk": "%(table_name)s_%(column_0_name)s_%(referred_table_name)s_fkey",
-                "pk": "%(table_name)s_pkey",
-            }
-        )
+        metadata = metadata or MetaData(naming_convention=_NAMING_CONVENTION)
         if base:
             self.base = base
         elif base_class:
             self.base = declarative_base(cls=base_class, metadata=metadata)
         else:
             self.base = declarative_base(name="Base", metadata=metadata)
-        if self.metadata.bind:
-            self._set_engine(self.metadata.bind)
+        self.metadata = self.base.metadata
+        bind = getattr(self.metadata, "bind", None)  # removed in SQLAlchemy 2
+        if bind:
+            self._set_engine(bind)
         if args or k:
             self.create_engine(*args, **k)
 
@@ -92,10 +114,50 @@ class SAContext:
         self.dburi = str(engine.url)
 
     def create_engine(self, dburi: str, **k):
-        """Set the engine according to ``dburi``."""
-        self._set_engine(create_engine(dburi, **k))
+        """Set the engine according to ``dburi``.
+
+        Unless the database is SQLite, the pool options in
+        ``engine_defaults`` are used where ``k`` does not override them.
+        They are left out when ``k`` provides its own ``pool``, and
+        ``pool_use_lifo`` is only given to a ``poolclass`` that is a QueuePool.
+        """
+        if not str(dburi).startswith("sqlite") and "pool" not in k:
+            defaults = self.engine_defaults
+            poolclass = k.get("poolclass")
+            if poolclass is not None and not issubclass(poolclass, QueuePool):
+                defaults = {
+                    key: val
+                    for key, val in defaults.items()
+                    if key != "pool_use_lifo"
+                }
+            k = {**defaults, **k}
+        self._set_engine(self._get_engine(dburi, k))
         return self
 
+    def _get_engine(self, dburi, k):
+        """Return an engine, reusing a live one created with the same args.
+
+        Each engine has its own pool, so sharing it means that clones of
+        an SAContext start with warm connections. In-memory SQLite
+        databases are never shared, since each engine is a separate database.
+        """
+        url = make_url(dburi)
+        if url.get_backend_name() == "sqlite" and url.database in (
+            None,
+            "",
+            ":memory:",
+        ):
+            return create_engine(dburi, **k)
+        try:
+            # str(url) would mask the password, mixing up credentials
+            key = (url.render_as_string(hide_password=False), frozenset(k.items()))
+            engine = self._engine_cache.get(key)
+        except TypeError:  # unhashable arguments such as connect_args
+            return create_engine(dburi, **k)
+        if engine is None:
+            engine = self._engine_cache[key] = create_engine(dburi, **k)
+        return engine
+
     def use_memory(self, tables=None, **k):
         """Create an in-memory SQLite engine, and create tables."""
         self.create_engine("sqlite:///:memory:", **k)
@@ -112,13 +174,11 @@ class SAContext:
             assert (
                 self.Session is not None
             ), "Tried to use the scoped session before the engine was set."
-            self._scoped_session = scoped_session(self.Session)
+            self._scoped_session = scoped_session(
+                self.Session, scopefunc=self.scopefunc
+            )
         return self._scoped_session
 
-    @property
-    def metadata(self):  # noqa
-        return self.base.metadata
-
     def drop_tables(self, tables=None):
         """Drop tables."""
         self.metadata.drop_all(tables=tables, bind=self.engine)
@@ -129,6 +189,29 @@ class SAContext:
         self.metadata.create_all(tables=tables, bind=self.engine)
         return self
 
+    def bulk_insert(self, table, rows, chunk_size: int = 1000) -> int:
+        """Insert ``rows`` (an iterable of dicts) into ``table`` efficiently.
+
+        ``table`` may be a Table or a mapped class. The rows are sent in
+        chunks of ``chunk_size`` through a Core INSERT with executemany,
+        all in one transaction, without instantiating ORM objects. Prefer
+        this to adding model instances one by one when importing large
+        amounts of data, e.g. from CSV files. Return the number of rows.
+        """
+        if not isinstance(table, Table):
+            table = table.__table__
+        statement = table.insert()
+        rows = iter(rows)
+        count = 0
+        with self.engine.begin() as connection:
+            while True:
+                chunk = list(islice(rows, chunk_size))
+                if not chunk:
+                    break
+                connection.execute(statement, chunk)
+                count += len(chunk)
+        return count
+
     def tables_in(self, context):
         """Return a list containing the tables in the passed *context*.
 
@@ -139,20 +222,44 @@ class SAContext:
         tables = []
         if isinstance(context, ModuleType):  # context is a python module
             context = context.__dict__
+        metadata = self.metadata
         for val in context.values():
-            if hasattr(val, "__base__") and val.__base__ is self.base:
-                tables.append(val.__table__)
-            elif isinstance(val, Table) and val.metadata is self.metadata:
+            if isinstance(val, type):
+                # Also finds subclasses of models (joined table inheritance)
+                mapper = inspect(val, raiseerr=False)
+                if (
+                    mapper is not None
+                    and not mapper.single
+                    and mapper.local_table.metadata is metadata
+                ):
+                    tables.append(mapper.local_table)
+            elif isinstance(val, Table) and val.metadata is metadata:
                 tables.append(val)
         return tables
 
-    def clone(self, **k):
-        """Copy this object. If keyword args, create another engine."""
-        from copy import copy
+    def clone(self, *args, **k):
+        """Copy this object. If arguments are given, create another engine.
 
+        The copy shares ``base`` and ``metadata`` with the original;
+        only the engine and session factory are replaced.
+        """
         o = copy(self)
-        if k:
-            o.create_engine(**k)
+        if args or k:
+            o._scoped_session = None
+            o.create_engine(*args, **k)
+        return o
+
+    def __copy__(self):
+        """Copy the slots directly instead of through ``__reduce_ex__``."""
+        cls = type(self)
+        o = cls.__new__(cls)
+        for klass in cls.__mro__:
+            slots = klass.__dict__.get("__slots__", ())
+            for name in (slots,) if isinstance(slots, str) else slots:
+                if hasattr(self, name):  # skip unset slots
+                    setattr(o, name, getattr(self, name))
+        if hasattr(self, "__dict__"):  # a subclass without __slots__
+            o.__dict__.update(self.__dict__)
         return o
 
     def subtransaction(self, fn):
@@ -160,18 +267,26 @@ class SAContext:
 
         Your system must use our ``ss`` scoped session and it
         does not need to call ``commit()`` on the session.
+        Inside a transaction, this is a SAVEPOINT, so an exception only
+        rolls back the function's work; otherwise a transaction is begun
+        and committed.
         """
 
         @wraps(fn)
         def wrapper(*a, **kw):
-            self.scoped_session.begin(subtransactions=True)
-            try:
-                fn(*a, **kw)
-            except Exception as exc:
-                self.scoped_session.rollback()
-                raise exc
+            # Skip the property once the scoped session exists
+            session = (self._scoped_session or self.scoped_session)()
+            if session.in_transaction():
+                tx = session.begin_nested()  # a SAVEPOINT in the outer one
             else:
-                self.scoped_session.commit()
+                tx = session.begin()
+            try:
+                result = fn(*a, **kw)
+            except Exception:
+                tx.rollback()
+                raise
+            tx.commit()
+            return result
 
         return wrapper
 
@@ -185,31 +300,47 @@ class SAContext:
         @wraps(fn)
         def wrapper(*a, **kw):
             try:
-                fn(*a, **kw)
-            except Exception as exc:
-                self.scoped_session.rollback()
-                raise exc
-            else:
-                self.scoped_session.commit()
+                result = fn(*a, **kw)
+            except Exception:
+                (self._scoped_session or self.scoped_session)().rollback()
+                raise
+            (self._scoped_session or self.scoped_session)().commit()
+            return result
 
         return wrapper
 
     def transient(self, fn):  # noqa
-        """Decorator. Create a subtransaction which is always rewinded.
+        """Decorator. Run the function in a transaction which is always rewinded.
 
         It is recommended that you apply this
         decorator to each of your integrated tests; then you only need to
         create the tables once, instead of once per test,
         because nothing ever gets persisted. This makes tests run faster.
+        While the function runs, the scoped session is bound to a connection
+        whose transaction is rolled back at the end; the session's own
+        commits only release SAVEPOINTs in it. With pysqlite, this requires
+        the SAVEPOINT workaround described in the SQLAlchemy SQLite docs.
         """
 
         @wraps(fn)
         def wrapper(*a, **kw):
-            self.scoped_session.begin(subtransactions=True)
-            self.scoped_session.begin(subtransactions=True)
+            scoped = self._scoped_session or self.scoped_session
+            previous = scoped.registry() if scoped.registry.has() else None
+            connection = self.engine.connect()
+            outer = connection.begin()
+            session = self.Session(
+                bind=connection, join_transaction_mode="create_savepoint"
+            )
+            scoped.registry.set(session)
             try:
-                fn(*a, **kw)  # I assume fn consumes the inner subtransaction.
+                return fn(*a, **kw)
             finally:
-                self.scoped_session.rollback()  # Revert outer subtransaction
+                session.close()
+                outer.rollback()  # Revert everything the function did
+                connection.close()
+                if previous is None:
+                    scoped.registry.clear()
+                else:
+                    scoped.registry.set(previous)
 
         return wrapper
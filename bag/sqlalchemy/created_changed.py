@@ -9,7 +9,7 @@ Usage::
         ...
 """
 
-from datetime import datetime
+from datetime import datetime, timezone
 
 from sqlalchemy import Column, DateTime, event
 
@@ -27,15 +27,24 @@ class CreatedChanged:
 def created_changed(cls):  # noqa
     """Decorate ``cls`` to update *created* and *changed* automatically.
 
-    If you use SQLAlchemy inheritance, apply this decorator to subclasses.
+    The listeners propagate, so subclasses (when using SQLAlchemy
+    inheritance) need not be decorated again.
+
+    Timestamps are computed in Python for each flushed object. For bulk
+    inserts that bypass the ORM, give the columns a server-side default
+    such as ``server_default=func.now()`` instead.
     """
+    now, utc = datetime.now, timezone.utc  # bound once, not per row
+
+    def utcnow():  # naive, like the deprecated datetime.utcnow()
+        return now(utc).replace(tzinfo=None)
 
     def _set_created_and_changed(mapper, connection, instance):
-        instance.created = instance.changed = datetime.utcnow()
+        instance.created = instance.changed = utcnow()
 
     def _set_changed(mapper, connection, instance):
-        instance.changed = datetime.utcnow()
+        instance.changed = utcnow()
 
-    event.listen(cls, "before_insert", _set_created_and_changed)
-    event.listen(cls, "before_update", _set_changed)
+    event.listen(cls, "before_insert", _set_created_and_changed, propagate=True)
+    event.listen(cls, "before_update", _set_changed, propagate=True)
     return cls
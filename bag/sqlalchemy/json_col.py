@@ -5,25 +5,90 @@ http://docs.sqlalchemy.org/en/latest/orm/extensions/mutable.html
 and altered such that the value is never None.
 """
 
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.mutable import Mutable
 from sqlalchemy.types import TypeDecorator, Unicode
-import json
+from json import dumps, loads
+
+try:
+    import orjson  # pip install orjson -- much faster than the stdlib
+except ImportError:
+    orjson = None
 
 
 class JSONEncodedDict(TypeDecorator):
     """Represents an immutable structure as a json-encoded string."""
 
     impl = Unicode
+    cache_ok = True
 
     def process_bind_param(self, value, dialect):
         if value is None:
             value = {}
-        return json.dumps(value)
+        return dumps(value)
 
     def process_result_value(self, value, dialect):
+        if value is None:
+            return {}
+        return loads(value)
+
+
+class OrjsonEncodedDict(JSONEncodedDict):
+    """Like JSONEncodedDict, but faster, using orjson if it is installed.
+
+    This is opt-in because orjson does not mean the same as the stdlib
+    in every case: it writes NaN and Infinity as ``null``. Integers
+    beyond 64 bits and the NaN/Infinity literals stored by the stdlib
+    are handed over to the stdlib json module, so those still work.
+    """
+
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):  # noqa
+        if orjson is None:
+            return super().process_bind_param(value, dialect)
         if value is None:
             value = {}
-        return json.loads(value)
+        try:
+            return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:  # e.g. "Integer exceeds 64-bit range"
+            return dumps(value)
+
+    def process_result_value(self, value, dialect):  # noqa
+        if value is None:
+            return {}
+        if orjson is None:
+            return loads(value)
+        try:
+            return orjson.loads(value)
+        except orjson.JSONDecodeError:  # e.g. NaN, written by the stdlib
+            return loads(value)
+
+
+class NativeJSONDict(JSONEncodedDict):
+    """Like JSONEncodedDict, but uses the native JSONB type on PostgreSQL.
+
+    There the driver does the (de)serialization and the column can be
+    indexed and queried; other databases get a json-encoded string.
+    Changing an existing column to this type requires a migration.
+    """
+
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect):  # noqa
+        if dialect.name == "postgresql":
+            return dialect.type_descriptor(JSONB())
+        return dialect.type_descriptor(Unicode())
+
+    def process_bind_param(self, value, dialect):  # noqa
+        if dialect.name == "postgresql":
+            return {} if value is None else value
+        return super().process_bind_param(value, dialect)
+
+    def process_result_value(self, value, dialect):  # noqa
+        if dialect.name == "postgresql":
+            return {} if value is None else value
+        return super().process_result_value(value, dialect)
 
 
 class MutableDict(Mutable, dict):
@@ -32,6 +97,9 @@ class MutableDict(Mutable, dict):
     Usage in a SQLAlchemy model::
 
         data = Column(MutableDict.as_mutable(JSONEncodedDict))
+
+    ...or, to store native JSONB on PostgreSQL, ``NativeJSONDict``;
+    for faster (de)serialization, ``OrjsonEncodedDict``.
     """
 
     @classmethod
@@ -57,3 +125,30 @@ class MutableDict(Mutable, dict):
         """Detect dictionary del events and emit change events."""
         dict.__delitem__(self, key)
         self.changed()
+
+    # The bulk methods below emit a single change event per call.
+
+    def update(self, *a, **k):  # noqa
+        dict.update(self, *a, **k)
+        self.changed()
+
+    def setdefault(self, key, default=None):  # noqa
+        if key in self:
+            return dict.__getitem__(self, key)
+        dict.__setitem__(self, key, default)
+        self.changed()
+        return default
+
+    def pop(self, *a):  # noqa
+        result = dict.pop(self, *a)
+        self.changed()
+        return result
+
+    def popitem(self):  # noqa
+        result = dict.popitem(self)
+        self.changed()
+        return result
+
+    def clear(self):  # noqa
+        dict.clear(self)
+        self.changed()
@@ -56,28 +56,38 @@ from .tricks import (
 
 class _IndentWriter:
 
-    def __init__(self):
+    def __init__(self, writer=None):
         self.indentation = 0
+        self._indent_str = ''  # kept in sync with self.indentation
         self.lines = []
+        self.writer = writer  # if present, lines go there instead
 
     def indent(self):
         self.indentation += 4
+        self._indent_str = ' ' * self.indentation
 
     def dedent(self):
         self.indentation -= 4
+        self._indent_str = ' ' * self.indentation
 
     def add(self, line):
-        self.lines.append(' ' * self.indentation + line)
+        if self.writer is None:
+            self.lines.append(self._indent_str + line)
+        else:
+            self.writer.write(self._indent_str)
+            self.writer.write(line)
+            self.writer.write('\n')
 
     def __str__(self):
         return '\n'.join(self.lines)
 
-# TODO Save memory by yielding lines instead of adding them to a list
-# TODO Provide a saving_to(file, generator, encoding='utf-8')
 # TODO Ability to register callbacks to be run after loading each instance.
 
 
 REPRESENTABLE = (int, str, float, Decimal, date, datetime, timedelta)
+# Exact types are found with one set lookup; subclasses (e.g. bool) still
+# go through isinstance().
+_REPRESENTABLE_TYPES = frozenset(REPRESENTABLE + (type(None),))
 
 
 class Mediovaigel(_IndentWriter):
@@ -105,18 +115,39 @@ class Mediovaigel(_IndentWriter):
 
     Take a look at the generated file, it has a function that you can use to
     load the fixtures on a database.
+
+    The above keeps all the fixtures in memory until the end. For large
+    databases, pass an open text file as ``writer`` instead; each
+    fixture is then written to it as soon as it is generated::
+
+        with open('fixtures/generated.py', 'w', encoding='utf-8',
+                  buffering=2**20) as writer:
+            m = Mediovaigel(writer=writer)
+            m.generate_fixtures(Course, sas=session)
+            m.generate_fixtures(Lecture, sas=session)
+
+    In this mode ``output()`` and ``save_to()`` raise RuntimeError, as
+    the file is already complete in the writer.
     """
 
-    def __init__(self, pk_property_name='id'):
+    def __init__(self, pk_property_name='id', writer=None,
+                 encoding='utf-8'):
         """Constructor.
 
         ``pk_property_name`` must be the name of the primary key column
         consistently used in your models.
+
+        If a ``writer`` is given, the beginning of the fixtures file is
+        written to it immediately, declaring ``encoding``.
         """
-        super(Mediovaigel, self).__init__()
+        super(Mediovaigel, self).__init__(writer=writer)
         self.pk = pk_property_name
-        self.imports = ['import datetime', 'from decimal import Decimal']
+        # A dict is an ordered set of the import lines, free of duplicates
+        self.imports = dict.fromkeys(
+            ['import datetime', 'from decimal import Decimal'])
         # self.refs = {}
+        if writer is not None:
+            writer.write(self._output(encoding=encoding))
         self.indent()
 
     def _serialize_property_value(self, val):
@@ -124,7 +155,7 @@ class Mediovaigel(_IndentWriter):
 
         Override this in subclasses to support other types.
         """
-        if val is None or isinstance(val, REPRESENTABLE):
+        if type(val) in _REPRESENTABLE_TYPES or isinstance(val, REPRESENTABLE):
             return repr(val)
 
     def serialize_property_value(self, entity, attrib):
@@ -164,50 +195,77 @@ class Mediovaigel(_IndentWriter):
         attribs = model_property_names(cls, blacklist=ignore_attribs,
                                        include_relationships=False)
         assert len(attribs) > 0
-        attribs = sorted(attribs)
-
-        self.imports.append('from {} import {}'.format(
-            cls.__module__, cls.__name__))
-        for entity in (query or sas.query(cls)).yield_per(50):
+        # Everything that does not vary per row is prepared only once.
+        # The attribute lines are one level deeper than the yield line.
+        head_template = 'yield ({}, ' + cls.__name__ + '('
+        attrib_templates = [(a, '    ' + a + '={},') for a in sorted(attribs)]
+        pk = self.pk
+        if type(self).serialize_property_value is \
+                Mediovaigel.serialize_property_value:
+            serialize = self._serialize_property_value
+        else:  # respect a subclass that overrides the public method
+            serialize = None
+        add = self.add
+
+        import_line = 'from {} import {}'.format(cls.__module__, cls.__name__)
+        if import_line not in self.imports:
+            self.imports[import_line] = None
+            if self.writer is not None:
+                # The header is already written; import inside the function.
+                self.add(import_line)
+        # stream_results makes the driver use a server-side cursor, so
+        # large tables are not buffered in memory before the first row.
+        query = (query or sas.query(cls)).execution_options(
+            stream_results=True)
+        for entity in query.yield_per(50):
             # if hasattr(entity, 'id'):
             #     ref = cls.__name__ + str(entity.id)
             # else:  # If there is no id, we generate our own random id:
             #     ref = cls.__name__ + str(uuid4())[-5:]
             # self.refs[ref] = entity
             # self.add('{} = {}('.format(ref, cls.__name__))
-            self.add('yield ({}, {}('.format(
-                getattr(entity, self.pk), cls.__name__))
-            self.indent()
-
-            for attrib in attribs:
-                val = self.serialize_property_value(entity, attrib)
-                self.add('{}={},'.format(attrib, val))
-
-            self.dedent()
-            self.add('))')
+            add(head_template.format(getattr(entity, pk)))
+            for attrib, template in attrib_templates:
+                val = serialize and serialize(getattr(entity, attrib))
+                if not val:  # slow path, which also reports errors
+                    val = self.serialize_property_value(entity, attrib)
+                add(template.format(val))
+            add('))')
             # self.add('session.add({})\n'.format(ref))
 
     def _process_table(self, resource_spec, ignore_attribs, sas):
         """Intended for association tables."""
         from sqlalchemy import select
         table = resolve(resource_spec)
-        cols = list(enumerate(table.c.keys()))
-        for row in sas.execute(select([table])).fetchall():
-            self.add("yield [")
-            self.indent()
+        # Decide once which columns are written, not for every row:
+        ignore_attribs = set(ignore_attribs)
+        indices = [index for index, colname in enumerate(table.c.keys())
+                   if colname not in ignore_attribs]
+        spec_line = "    '{}',".format(resource_spec)
+        serialize = self._serialize_property_value
+        add = self.add
+        result = sas.execute(
+            select(table).execution_options(stream_results=True))
+        for row in result:
+            add("yield [")
+            add(spec_line)
+            for index in indices:
+                add("    {},".format(serialize(row[index])))
+            add(']')
 
-            self.add("'{}',".format(resource_spec))
-            for index, colname in cols:
-                if colname in ignore_attribs:
-                    continue
-                self.add("{},".format(
-                    self._serialize_property_value(row[index])))
+    def output(self, encoding='utf-8'):
+        """Return the final Python code with the fixture functions.
 
-            self.dedent()
-            self.add(']')
+        Raise RuntimeError if a ``writer`` was given, since then the
+        fixtures have already gone to it instead of being kept here.
+        """
+        if self.writer is not None:
+            raise RuntimeError(
+                'The fixtures were written to the writer passed to '
+                'Mediovaigel, so there is no output to return.')
+        return self._output(encoding=encoding)
 
-    def output(self, encoding='utf-8'):
-        """Return the final Python code with the fixture functions."""
+    def _output(self, encoding='utf-8'):
         return TEMPLATE.format(
             encoding=encoding, when=str(datetime.utcnow())[:16],
             imports='\n'.join(self.imports), pk=self.pk,
@@ -215,9 +273,10 @@ class Mediovaigel(_IndentWriter):
         )
 
     def save_to(self, path, encoding='utf-8'):
-        """Save fixtures to ``path``."""
+        """Save fixtures to ``path``. Not available with a ``writer``."""
+        content = self.output(encoding=encoding)
         with open(path, 'w', encoding=encoding) as writer:
-            writer.write(self.output(encoding=encoding))
+            writer.write(content)
 
 
 TEMPLATE = """\
@@ -250,6 +309,10 @@ class load_fixtures:
         self.mapp = key_val_db or {}  # maps original IDs to new IDs
         # This stores the foreign keys dict for each model class:
         self.cached_fks = {}
+        # ...and this, the table and its foreign key columns for each table:
+        self.cached_tables = {}
+        # ...and this, the name of the table each ForeignKey points to:
+        self.fk_targets = {}
         # This stores entities whose creation must be delayed due to
         # the temporary inexistence of other entities:
         self.delayed = {}
@@ -320,32 +383,42 @@ class load_fixtures:
     def _load_row(self, original_values):
         from sqlalchemy import insert
         values = copy(original_values)
-        table = resolve(values.pop(0))  # TODO Cache
-        cols = list(enumerate(table.c.keys()))  # TODO Cache
-        for index, col in cols:
-            fk = foreign_key_from_col(table.c[col])
-            if fk:
-                # Replace the old FK value with the NEW id stored in mapp
-                old_fk_value = values[index]
-                if old_fk_value is None:
-                    continue
-                try:
-                    values[index] = self._get_new_id(fk, old_fk_value)
-                except KeyError as e:
-                    print('Delaying {} row for lack of {}'.format(
-                          table.name, e))
-                    # Store this job so it will be retried later:
-                    self._delay_creation(
-                        e.args[0], self._load_row, original_values)
-                    return False
-        self.sas.execute(insert(table, values=values))
+        resource_spec = values.pop(0)
+        cached = self.cached_tables.get(resource_spec)
+        if cached is None:
+            table = resolve(resource_spec)
+            fk_cols = []
+            for index, col in enumerate(table.c):
+                fk = foreign_key_from_col(col)
+                if fk:
+                    fk_cols.append((index, fk))
+            cached = self.cached_tables[resource_spec] = (table, fk_cols)
+        table, fk_cols = cached
+        for index, fk in fk_cols:
+            # Replace the old FK value with the NEW id stored in mapp
+            old_fk_value = values[index]
+            if old_fk_value is None:
+                continue
+            try:
+                values[index] = self._get_new_id(fk, old_fk_value)
+            except KeyError as e:
+                print('Delaying {} row for lack of {}'.format(
+                      table.name, e))
+                # Store this job so it will be retried later:
+                self._delay_creation(
+                    e.args[0], self._load_row, original_values)
+                return False
+        self.sas.execute(insert(table).values(tuple(values)))
         return True
 
     def _get_new_id(self, fk, old_id):
         """Given a ForeignKey object and its value in the old database,
         looks up the cache and returns the value for the new database.
         """
-        table_name = fk.target_fullname.split('.')[0]
+        table_name = self.fk_targets.get(fk)
+        if table_name is None:
+            table_name = self.fk_targets[fk] = \
+                fk.target_fullname.split('.')[0]
         return self.mapp[table_name + str(old_id)]
 
     def _delay_creation(self, wanted, method, *args):
@@ -354,8 +427,4 @@ class load_fixtures:
         In the dict, the key is the non-existent entity key, and the value
         is a tuple with the arguments to the creation method.
         """
-        val = (method, args)
-        if wanted in self.delayed:
-            self.delayed[wanted].append(val)
-        else:
-            self.delayed[wanted] = [val]
+        self.delayed.setdefault(wanted, []).append((method, args))
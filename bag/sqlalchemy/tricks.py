@@ -200,7 +200,8 @@ def pk(tablename: str) -> Column:
 
 def is_model_class(val) -> bool:
     """Return whether the parameter is a SQLAlchemy model class."""
-    return hasattr(val, "__base__") and hasattr(val, "__table__")
+    # isinstance() is cheap; hasattr() raises and catches for non-classes.
+    return isinstance(val, type) and hasattr(val, "__table__")
 
 
 def models_and_tables_in(arg) -> Tuple[list, list]:
@@ -223,6 +224,9 @@ def model_property_names(
 ):
     """Return the property names in the passed class, maybe filtered."""
     names = (str(n).split(".")[1] for n in cls.__mapper__.iterate_properties)
+    # Sets make each membership test O(1) instead of a scan of a list
+    blacklist = set(blacklist) if blacklist else None
+    whitelist = set(whitelist) if whitelist else None
     filtered = []
     for name in names:
         if blacklist and name in blacklist:
@@ -291,13 +295,15 @@ class MinimalBase:
 
         Optionally check that the keys exist.
         """
-        for k, v in adict.items():
-            if not transient:
+        if not transient:
+            cls = type(self)
+            for k in adict:
                 assert hasattr(
-                    type(self), k
+                    cls, k
                 ), "Model {} does not have a '{}' attribute.".format(
-                    type(self).__name__, k
+                    cls.__name__, k
                 )
+        for k, v in adict.items():
             setattr(self, k, v)
         return self
 
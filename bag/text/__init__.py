@@ -16,7 +16,21 @@ def parse_iso_date(txt: str) -> datetime:
         "parse_iso_date() is deprecated. Use datetime.fromisoformat() instead.",
         DeprecationWarning
     )
-    return datetime.strptime(txt[:19], "%Y-%m-%d %H:%M:%S")
+    # Slicing the fixed "%Y-%m-%d %H:%M:%S" format is much faster than
+    # strptime(), and unlike fromisoformat() it rejects other formats.
+    s = txt[:19]
+    if len(s) != 19 or s[4] + s[7] + s[10] + s[13] + s[16] != "-- ::":
+        raise ValueError(
+            "time data {!r} does not match format '%Y-%m-%d %H:%M:%S'".format(s)
+        )
+    return datetime(
+        int(s[0:4]),
+        int(s[5:7]),
+        int(s[8:10]),
+        int(s[11:13]),
+        int(s[14:16]),
+        int(s[17:19]),
+    )
 
 
 def shorten(txt: str, length: int = 10, ellipsis: str = "…") -> str:
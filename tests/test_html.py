@@ -1,7 +1,7 @@
 """Tests the *html* module."""
 
 from unittest import TestCase
-from bag.html import decode_entities, encode_xml_char_refs
+from bag.html import decode_entities, encode_xml_char_refs, html_to_unicode
 
 
 class TestHtml(TestCase):
@@ -13,3 +13,11 @@ class TestHtml(TestCase):
         t = t.decode('utf-8')
         u = decode_entities(t)  # convert it back to the original
         assert s == u, "Conversion to XML char refs and back failed!"
+
+    def test_named_entities(self):
+        assert decode_entities("&lt;a&gt; &amp; &apos;b&apos;") == "<a> & 'b'"
+        assert decode_entities("&eacute;&nbsp;&bogus;") == "é\xa0&bogus;"
+
+    def test_html_to_unicode(self):
+        html = "\tOne\r\ntwo  <br />three<br>four<br/>\n"
+        assert html_to_unicode(html) == "One two \nthree\nfour"
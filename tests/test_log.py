@@ -0,0 +1,70 @@
+"""Tests the *log* module."""
+
+import logging
+import os
+from logging.handlers import RotatingFileHandler
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from bag.log import setup_log
+
+
+class TestSetupLog(TestCase):
+
+    def setUp(self):
+        self._tmp = TemporaryDirectory()
+        self.dir = self._tmp.name
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _cleanup(self, log):
+        handlers = list(log.handlers)
+        level = log.level
+
+        def restore():
+            for handler in log.handlers:
+                if handler not in handlers:
+                    log.removeHandler(handler)
+                    handler.close()
+            log.setLevel(level)
+
+        self.addCleanup(restore)
+
+    def test_calling_again_does_not_duplicate_handlers(self):
+        log = logging.getLogger("bag.tests.log.twice")
+        self._cleanup(log)
+        setup_log(log.name, path=self.dir)
+        self.assertEqual(len(log.handlers), 2)
+        self.assertIs(setup_log(log.name, path=self.dir), log)
+        self.assertEqual(len(log.handlers), 2)
+
+    def test_foreign_handlers_do_not_prevent_setup(self):
+        log = logging.getLogger()  # like logging.basicConfig() would
+        self._cleanup(log)
+        foreign = logging.NullHandler()
+        log.addHandler(foreign)
+        setup_log(path=self.dir, screen_level=None)
+        self.assertIn(foreign, log.handlers)
+        self.assertTrue(
+            any(isinstance(h, RotatingFileHandler) for h in log.handlers))
+
+    def test_log_directory_is_created(self):
+        log = logging.getLogger("bag.tests.log.makedirs")
+        self._cleanup(log)
+        path = os.path.join(self.dir, "a", "b")
+        setup_log(log.name, path=path, screen_level=None)
+        self.assertTrue(os.path.isdir(path))
+        other = logging.getLogger("bag.tests.log.makedirs2")  # path exists
+        self._cleanup(other)
+        setup_log(other.name, path=path, screen_level=None)
+
+    def test_log_file_is_opened_on_first_emit(self):
+        log = logging.getLogger("bag.tests.log.delay")
+        self._cleanup(log)
+        setup_log(log.name, path=self.dir, screen_level=None)
+        self.assertEqual(os.listdir(self.dir), [])
+        log.debug("hello")
+        (name,) = os.listdir(self.dir)
+        with open(os.path.join(self.dir, name), encoding="utf-8") as stream:
+            self.assertEqual(stream.read(), "hello\n")
@@ -0,0 +1,35 @@
+"""Tests the *monkeypatch* module."""
+
+from unittest import TestCase
+
+from bag.monkeypatch import monkeypatch
+
+
+class TestMonkeypatch(TestCase):
+
+    def test_monkeypatch(self):
+        class Thing:
+            pass
+
+        @monkeypatch(Thing)
+        def method(self):
+            return 1
+
+        @monkeypatch(Thing)
+        @property
+        def prop(self):
+            return 2
+
+        @monkeypatch(Thing, "renamed")
+        def other(self):
+            return 3
+
+        thing = Thing()
+        self.assertEqual(thing.method(), 1)
+        self.assertEqual(thing.prop, 2)
+        self.assertEqual(thing.renamed(), 3)
+        self.assertFalse(hasattr(Thing, "other"))
+        # The decorated functions are returned unchanged
+        self.assertEqual(method(thing), 1)
+        self.assertIsInstance(prop, property)
+        self.assertEqual(other(thing), 3)
@@ -0,0 +1,92 @@
+"""Tests the *pathlib_complement* module."""
+
+import os
+import re
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from bag.pathlib_complement import Path, oct2int
+
+
+class TestPath(TestCase):
+
+    def setUp(self):
+        self._tmp = TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        (self.root / "sub" / "deeper").mkdir(parents=True)
+        (self.root / "a.txt").write_text("a")
+        (self.root / "sub" / "b.py").write_text("b")
+        (self.root / "sub" / "deeper" / "c.txt").write_text("c")
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_traverse(self):
+        found = {p.relative_to(self.root).as_posix()
+                 for p in self.root.traverse()}
+        self.assertEqual(
+            found, {"a.txt", "sub", "sub/b.py", "sub/deeper",
+                    "sub/deeper/c.txt"})
+        self.assertIsInstance(next(self.root.traverse()), Path)
+        self.assertIn(self.root, list(self.root.traverse(this=True)))
+
+    def test_traverse_filter(self):
+        found = [p.name for p in
+                 self.root.traverse(filter=lambda p: p.suffix == ".txt")]
+        self.assertEqual(sorted(found), ["a.txt", "c.txt"])
+
+    def test_traverse_name_regex(self):
+        found = [p.name for p in self.root.traverse(
+            name_regex=re.compile(r"\.txt$"), filter=lambda p: p.is_file())]
+        self.assertEqual(sorted(found), ["a.txt", "c.txt"])
+
+    def test_recursive_chmod(self):
+        self.root.recursive_chmod(640)
+        self.assertEqual(os.stat(self.root / "a.txt").st_mode & 0o777, 0o640)
+        self.assertEqual(os.stat(self.root / "sub").st_mode & 0o777, 0o750)
+        self.assertEqual(os.stat(self.root).st_mode & 0o777, 0o750)
+
+    def test_empty(self):
+        self.root.empty()
+        self.assertEqual(list(self.root.iterdir()), [])
+
+    def test_remove(self):
+        link = self.root / "link"
+        link.symlink_to(self.root / "sub")
+        link.remove()
+        self.assertTrue((self.root / "sub" / "b.py").exists())
+        (self.root / "sub").remove()
+        (self.root / "a.txt").remove()
+        self.assertEqual(list(self.root.iterdir()), [])
+        self.root.ensure_directory()
+
+    def test_recursive_chgrp(self):
+        gid = os.stat(self.root).st_gid
+        self.root.recursive_chgrp(gid, this=True)
+        self.assertEqual(os.stat(self.root / "sub" / "b.py").st_gid, gid)
+
+    def test_recursive_chmod_parallel(self):
+        for i in range(6):
+            (self.root / "sub" / str(i)).mkdir()
+            (self.root / "sub" / str(i) / "f").write_text("f")
+        self.root.recursive_chmod_parallel(640, workers=3)
+        self.assertEqual(
+            os.stat(self.root / "sub" / "5" / "f").st_mode & 0o777, 0o640)
+        self.assertEqual(os.stat(self.root / "sub" / "5").st_mode & 0o777, 0o750)
+        self.assertEqual(os.stat(self.root).st_mode & 0o777, 0o750)
+
+    def test_copy(self):
+        self.root.joinpath("sub").copy(self.root / "copied")
+        self.assertEqual(
+            (self.root / "copied" / "deeper" / "c.txt").read_text(), "c")
+        with self.assertRaises(RuntimeError):
+            (self.root / "missing").copy(self.root / "other")
+
+
+class TestOct2Int(TestCase):
+
+    def test_oct2int(self):
+        self.assertEqual(oct2int(644), 0o644)
+        self.assertEqual(oct2int("755"), 0o755)
+        with self.assertRaises(ValueError):
+            oct2int("__import__('os')")
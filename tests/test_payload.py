@@ -0,0 +1,70 @@
+"""Tests the *payload* module."""
+
+import os
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+
+from requests import HTTPError
+
+from bag.payload import retrieve_payload, retrieve_payload_to
+
+
+def _response(chunks=(), error=None):
+    response = MagicMock()
+    response.__enter__.return_value = response
+    response.content = b"".join(chunks)
+    response.iter_content.return_value = iter(chunks)
+    if error:
+        response.raise_for_status.side_effect = error
+    return response
+
+
+class TestPayload(TestCase):
+
+    def setUp(self):
+        self._tmp = TemporaryDirectory()
+        self.dir = self._tmp.name
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_retrieve_payload_from_url(self):
+        with patch("bag.payload.requests.get",
+                   return_value=_response([b"abc"])) as get:
+            self.assertEqual(retrieve_payload("https://x.com/a"), b"abc")
+        get.assert_called_once_with("https://x.com/a")
+
+    def test_retrieve_payload_raises_http_errors(self):
+        response = _response(error=HTTPError("404"))
+        with patch("bag.payload.requests.get", return_value=response):
+            with self.assertRaises(HTTPError):
+                retrieve_payload("http://x.com/missing")
+
+    def test_retrieve_payload_to_streams(self):
+        response = _response([b"ab", b"cd", b"e"])
+        path = os.path.join(self.dir, "out")
+        with patch("bag.payload.requests.get", return_value=response) as get:
+            retrieve_payload_to("https://x.com/a", path, chunk_size=2)
+        get.assert_called_once_with("https://x.com/a", stream=True)
+        response.iter_content.assert_called_once_with(chunk_size=2)
+        with open(path, "rb") as stream:
+            self.assertEqual(stream.read(), b"abcde")
+
+    def test_retrieve_payload_to_raises_http_errors(self):
+        response = _response([b"oops"], error=HTTPError("500"))
+        path = os.path.join(self.dir, "out")
+        with patch("bag.payload.requests.get", return_value=response):
+            with self.assertRaises(HTTPError):
+                retrieve_payload_to("https://x.com/a", path)
+        self.assertFalse(os.path.exists(path))
+
+    def test_local_paths(self):
+        source = os.path.join(self.dir, "source")
+        with open(source, "wb") as stream:
+            stream.write(b"local")
+        self.assertEqual(retrieve_payload(source), b"local")
+        path = os.path.join(self.dir, "copy")
+        retrieve_payload_to(source, path)
+        with open(path, "rb") as stream:
+            self.assertEqual(stream.read(), b"local")
@@ -0,0 +1,95 @@
+"""Tests the *replace_many* module."""
+
+import mmap
+import os
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from unittest.mock import patch
+
+from bag.pathlib_complement import Path
+from bag.replace_many import replace_many, replace_many_multi
+
+
+class TestReplaceMany(TestCase):
+
+    def setUp(self):
+        self._tmp = TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        (self.root / "sub").mkdir()
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _write(self, name, content):
+        path = self.root / name
+        path.write_bytes(content.encode("utf-8"))
+        return path
+
+    def _read(self, path):
+        return path.read_bytes().decode("utf-8")
+
+    def test_replace_many(self):
+        a = self._write("a.py", "foo = 'foo'\n")
+        b = self._write("sub/b.py", "no match\n")
+        replace_many(".py", "foo", "bar", dir=str(self.root))
+        self.assertEqual(self._read(a), "bar = 'bar'\n")
+        self.assertEqual(self._read(b), "no match\n")
+
+    def test_longest_text_wins(self):
+        path = self._write("a.txt", "foo foobar bar")
+        replace_many_multi(
+            "txt", [("foo", "1"), ("foobar", "2"), ("bar", "3")],
+            dir=str(self.root))
+        self.assertEqual(self._read(path), "1 2 3")
+
+    def test_extensions_ignore_case_and_dot(self):
+        upper = self._write("A.PY", "foo")
+        jinja = self._write("sub/b.Jinja2", "foo")
+        other = self._write("c.txt", "foo")
+        replace_many_multi(
+            ".py, jinja2", [("foo", "bar")], dir=str(self.root))
+        self.assertEqual(self._read(upper), "bar")
+        self.assertEqual(self._read(jinja), "bar")
+        self.assertEqual(self._read(other), "foo")
+
+    def test_compound_extensions(self):
+        archive = self._write("a.tar.gz", "foo")
+        template = self._write("sub/b.HTML.jinja2", "foo")
+        plain = self._write("c.gz", "foo")
+        replace_many_multi(
+            "tar.gz,.html.jinja2", [("foo", "bar")], dir=str(self.root))
+        self.assertEqual(self._read(archive), "bar")
+        self.assertEqual(self._read(template), "bar")
+        self.assertEqual(self._read(plain), "foo")
+
+    def test_unmatched_files_are_not_rewritten(self):
+        path = self._write("a.py", "nothing to see")
+        os.utime(path, (1000000000, 1000000000))
+        replace_many_multi("py", [("foo", "bar")], dir=str(self.root))
+        self.assertEqual(os.stat(path).st_mtime, 1000000000)
+
+    def test_crlf_line_endings_are_kept(self):
+        path = self._write("a.py", "foo\r\nfoo\r\n")
+        replace_many_multi("py", [("foo", "bar")], dir=str(self.root))
+        self.assertEqual(path.read_bytes(), b"bar\r\nbar\r\n")
+
+    def test_large_files_use_mmap(self):
+        big = self._write("big.py", "x" * 20 + "foo")
+        unmatched = self._write("other.py", "y" * 20)
+        os.utime(unmatched, (1000000000, 1000000000))
+        with patch("bag.replace_many.MMAP_THRESHOLD", 8), \
+                patch("bag.replace_many.mmap.mmap",
+                      wraps=mmap.mmap) as mapping:
+            replace_many_multi("py", [("foo", "bar")], dir=str(self.root))
+        self.assertEqual(mapping.call_count, 2)
+        self.assertEqual(self._read(big), "x" * 20 + "bar")
+        self.assertEqual(os.stat(unmatched).st_mtime, 1000000000)
+
+    def test_workers(self):
+        paths = [self._write("f{}.py".format(n), "foo {}".format(n))
+                 for n in range(10)]
+        replace_many_multi(
+            "py", [("foo", "bar")], dir=str(self.root), workers=4)
+        self.assertEqual(
+            [self._read(p) for p in paths],
+            ["bar {}".format(n) for n in range(10)])
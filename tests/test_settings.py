@@ -0,0 +1,43 @@
+"""Tests the *settings* module."""
+
+import os
+from pathlib import Path
+from unittest import TestCase
+
+import bag
+from bag.settings import SettingsReader, resolve, resolve_path
+
+
+class TestResolve(TestCase):
+
+    def test_resolve(self):
+        self.assertIs(resolve("os.path"), os.path)
+        self.assertIs(resolve("os.path:join"), os.path.join)
+        self.assertIs(resolve(os.path.join), os.path.join)  # passed through
+        self.assertIs(resolve(os), os)
+        with self.assertRaises(ValueError):
+            resolve("a:b:c")
+
+    def test_resolve_path(self):
+        self.assertEqual(
+            resolve_path("bag:spreadsheet"),
+            Path(bag.__path__[0], "spreadsheet"))
+
+    def test_failed_imports_are_retried(self):
+        for _ in range(2):
+            with self.assertRaises(ImportError):
+                resolve("no_such_module_here:thing")
+
+
+class TestSettingsReader(TestCase):
+
+    def test_read(self):
+        reader = SettingsReader({"a": "1", "flag": "yes", "empty": ""})
+        self.assertEqual(reader.read("a"), "1")
+        self.assertEqual(reader.read("missing", default=2), 2)
+        self.assertIs(reader.bool("flag"), True)
+        with self.assertRaises(RuntimeError):
+            reader.read("empty", required=True)
+
+    def test_slots(self):
+        self.assertFalse(hasattr(SettingsReader({}), "__dict__"))
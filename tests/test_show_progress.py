@@ -0,0 +1,119 @@
+"""Tests the *show_progress* module."""
+
+from contextlib import redirect_stdout
+from datetime import datetime, timedelta
+from io import StringIO
+from unittest import TestCase
+from unittest.mock import patch
+
+from bag.show_progress import PercentageDone, ShowingPercentage, ShowingProgress
+
+
+class FakeClock:
+    """Replaces monotonic_ns(); ``advance()`` moves time forward."""
+
+    def __init__(self):
+        self.ns = 0
+
+    def __call__(self):
+        return self.ns
+
+    def advance(self, seconds):
+        self.ns += int(seconds * 1e9)
+
+
+class TestShowingProgress(TestCase):
+
+    def setUp(self):
+        self.clock = FakeClock()
+        patcher = patch("bag.show_progress.monotonic_ns", self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _run(self, iterable, **k):
+        out = StringIO()
+        with redirect_stdout(out):
+            indices = [index for index, _ in ShowingProgress(iterable, **k)]
+        return indices, out.getvalue().splitlines()
+
+    def _items(self, delays):
+        for delay in delays:
+            self.clock.advance(delay)
+            yield delay
+
+    def test_prints_every_so_many_seconds(self):
+        indices, lines = self._run(
+            self._items([1] * 10), seconds=3, message="#{}", done="")
+        self.assertEqual(indices, list(range(1, 11)))
+        self.assertEqual(lines, ["#3", "#6", "#9"])
+
+    def test_slow_items_after_fast_ones_are_reported(self):
+        delays = [1e-6] * 200000 + [0.1] * 30
+        _, lines = self._run(
+            self._items(delays), seconds=0.5, message="#{}", done="")
+        slow_phase = [line for line in lines if int(line[1:]) > 200000]
+        self.assertGreaterEqual(len(slow_phase), 5)
+
+    def test_done(self):
+        _, lines = self._run(self._items([1, 1]), seconds=60)
+        self.assertEqual(lines, ["Done in 0:00:02! Total items: 2"])
+
+
+class TestPercentageDone(TestCase):
+
+    def test_start_and_printed_are_datetimes(self):
+        p = PercentageDone(10)
+        self.assertIsInstance(p.start, datetime)
+        self.assertIsInstance(p.printed, datetime)
+
+    def test_granularity(self):
+        p = PercentageDone(10, granularity=1.5)
+        self.assertEqual(p.granularity, timedelta(seconds=1.5))
+        p.granularity = timedelta(seconds=3)
+        self.assertEqual(p._granularity_ns, 3000000000)
+
+    def test_calc_uses_whole_percents(self):
+        p = PercentageDone(300)
+        self.assertIsNotNone(p.calc(4))
+        self.assertEqual(p.current, 1)
+        self.assertIsNone(p.calc(5))  # still 1%
+
+
+class TestShowingPercentage(TestCase):
+
+    def setUp(self):
+        self.clock = FakeClock()
+        patcher = patch("bag.show_progress.monotonic_ns", self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_prints_percentages(self):
+        out = StringIO()
+        with redirect_stdout(out):
+            for index, item in ShowingPercentage(range(10), 10, granularity=2):
+                self.clock.advance(1)
+        # Indices start at 0, so index 1 is displayed after 2 seconds
+        self.assertEqual(out.getvalue().splitlines(), [
+            "10% done, 0:00:18 left...",
+            "30% done, 0:00:09 left...",
+            "50% done, 0:00:06 left...",
+            "70% done, 0:00:03 left...",
+            "90% done, 0:00:01 left...",
+        ])
+
+    def test_display_is_throttled_by_count(self):
+        with patch.object(ShowingPercentage, "display") as display:
+            items = list(ShowingPercentage(range(10000), 10000))
+        self.assertEqual(len(items), 10000)
+        self.assertEqual(display.call_count, 1000)
+
+
+class TestSlots(TestCase):
+
+    def test_no_instance_dict(self):
+        for obj in (
+            ShowingProgress(range(3)),
+            PercentageDone(3),
+            ShowingPercentage(range(3), 3),
+        ):
+            self.assertFalse(hasattr(obj, "__dict__"), type(obj).__name__)
@@ -1,7 +1,14 @@
 """Tests the *spreadsheet* module."""
 
+from codecs import BOM_UTF8
+from io import BytesIO, StringIO
 from unittest import TestCase
-from bag.spreadsheet import (raise_if_forbidden_headers, ForbiddenHeaders)
+from bag.spreadsheet import (
+    get_corresponding_variable_names, raise_if_forbidden_headers,
+    raise_if_missing_required_headers, validate_headers,
+    ForbiddenHeaders, MissingHeaders)
+from bag.spreadsheet.csv import (
+    buffered_csv_writing, csv_with_headers_reader, DecodingCsvWithHeaders)
 
 
 class TestSpreadsheet(TestCase):
@@ -28,3 +35,103 @@ class TestSpreadsheet(TestCase):
                 )
             self.assertEqual(err.forbidden_headers[0], 'number')
             self.assertEqual(err.forbidden_headers[1], '2')
+
+    def test_missing_headers(self):
+        self.assertIsNone(raise_if_missing_required_headers(
+            ['Name', None, 'E-mail'], required_headers=['name', 'e-mail']))
+        with self.assertRaises(MissingHeaders) as cm:
+            raise_if_missing_required_headers(
+                ['Name', 'E-mail'], required_headers=['name', 'Phone'])
+        self.assertEqual(cm.exception.missing_headers, ['Phone'])
+        with self.assertRaises(MissingHeaders):
+            raise_if_missing_required_headers(
+                ['Name'], required_headers=['name'], case_sensitive=True)
+
+    def test_variable_names(self):
+        self.assertEqual(
+            get_corresponding_variable_names(
+                ['Full Name', None, 'E-mail'], {'E-MAIL': 'email'}),
+            ['full_name', None, 'email'])
+
+    def test_validate_headers(self):
+        self.assertEqual(
+            validate_headers(['Name', 'E-mail'], ['name'], ['phone']),
+            ['name', 'e_mail'])
+        with self.assertRaises(ForbiddenHeaders):
+            validate_headers(['Name', 'Phone'], ['name'], ['phone'])
+
+
+class TestCsv(TestCase):
+
+    def test_csv_with_headers_reader(self):
+        stream = StringIO('Name,E-mail\n a ,b\nc,d\n')
+        rows = list(csv_with_headers_reader(stream, required_headers=['name']))
+        self.assertEqual(
+            [(row.name, row.e_mail) for row in rows], [('a', 'b'), ('c', 'd')])
+
+    def test_csv_with_non_ascii_headers(self):
+        # Python would compile ``row.nº`` as ``row.no``, hence getattr()
+        rows = list(csv_with_headers_reader(StringIO('Nº,Nome\n1,Ana\n')))
+        self.assertEqual(getattr(rows[0], 'nº'), '1')
+        self.assertEqual(rows[0].nome, 'Ana')
+
+    def test_decoding_csv_with_headers(self):
+        stream = BytesIO(BOM_UTF8 + 'Nome,Cidade\nJosé,São Paulo\n'.encode())
+        rows = list(DecodingCsvWithHeaders(stream, encoding='utf8'))
+        self.assertEqual(rows[0].nome, 'José')
+        self.assertEqual(rows[0].cidade, 'São Paulo')
+
+    def test_buffered_csv_writing(self):
+        rows = [['José', str(n)] for n in range(5)]
+        chunks = list(buffered_csv_writing(
+            rows, headers=['name', 'n'], buffer_rows=2))
+        self.assertTrue(all(isinstance(c, bytes) for c in chunks))
+        self.assertEqual(len(chunks), 3)  # 6 lines, including the headers
+        self.assertEqual(
+            b''.join(chunks).decode('utf8'),
+            'name,n\r\n' + ''.join('José,{}\r\n'.format(n) for n in range(5)))
+
+    def test_buffered_csv_writing_utf16_has_one_bom(self):
+        rows = [['a', str(n)] for n in range(5)]
+        content = b''.join(buffered_csv_writing(
+            rows, encoding='utf16', buffer_rows=2))
+        self.assertEqual(content.decode('utf16').count('\ufeff'), 0)
+        self.assertEqual(content.decode('utf16').count('a,'), 5)
+
+
+class TestExcel(TestCase):
+
+    def _xlsx(self, rows):
+        from openpyxl import Workbook
+        wb = Workbook()
+        for row in rows:
+            wb.active.append(row)
+        stream = BytesIO()
+        wb.save(stream)
+        stream.seek(0)
+        return stream
+
+    def test_excel_reader(self):
+        from bag.spreadsheet.excel import excel_reader
+        stream = self._xlsx([['Name', ' Age '], ['Ann', 31], ['Bob', 42]])
+        rows = list(excel_reader(stream, required_headers=['name']))
+        self.assertEqual(
+            [(row.name, row.age) for row in rows], [('Ann', 31), ('Bob', 42)])
+
+    def test_excel_reader_with_non_identifier_headers(self):
+        from bag.spreadsheet.excel import excel_reader
+        stream = self._xlsx([['Name', 'Phone (home)', '1st'], ['Ann', '555', 1]])
+        rows = list(excel_reader(stream))
+        self.assertEqual(rows[0].name, 'Ann')
+        self.assertEqual(getattr(rows[0], 'phone_(home)'), '555')
+        self.assertEqual(getattr(rows[0], '1st'), 1)
+
+    def test_excel_reader_calamine(self):
+        from bag.spreadsheet.excel import CalamineWorkbook, excel_reader
+        if CalamineWorkbook is None:
+            self.skipTest('python-calamine is not installed')
+        stream = self._xlsx([['Name', ' Age '], ['Ann', 31], ['Bob', 42]])
+        rows = list(excel_reader(
+            stream, required_headers=['name'], engine='calamine'))
+        self.assertEqual(
+            [(row.name, row.age) for row in rows], [('Ann', 31), ('Bob', 42)])
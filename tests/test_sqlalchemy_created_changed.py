@@ -0,0 +1,62 @@
+"""Tests for the bag.sqlalchemy.created_changed module."""
+
+from datetime import datetime, timedelta, timezone
+from unittest import TestCase
+
+from sqlalchemy import Column, ForeignKey, Integer, Unicode
+
+from bag.sqlalchemy.context import SAContext
+from bag.sqlalchemy.created_changed import CreatedChanged, created_changed
+
+
+class TestCreatedChanged(TestCase):
+
+    def setUp(self):
+        self.sa = SAContext()
+
+        @created_changed
+        class Thing(self.sa.base, CreatedChanged):
+            __tablename__ = "thing"
+            id = Column(Integer, primary_key=True)
+            kind = Column(Unicode(20))
+            name = Column(Unicode(20))
+            __mapper_args__ = {"polymorphic_on": kind, "polymorphic_identity": "thing"}
+
+        class SubThing(Thing):  # not decorated
+            __tablename__ = "sub_thing"
+            id = Column(Integer, ForeignKey("thing.id"), primary_key=True)
+            __mapper_args__ = {"polymorphic_identity": "sub"}
+
+        self.Thing, self.SubThing = Thing, SubThing
+        self.sa.use_memory()
+        self.session = self.sa.Session()
+
+    def tearDown(self):
+        self.session.close()
+
+    def test_timestamps(self):
+        thing = self.Thing(name="a")
+        self.session.add(thing)
+        self.session.flush()
+        assert thing.created is not None
+        assert thing.changed == thing.created
+        created = thing.created
+        thing.name = "b"
+        self.session.flush()
+        assert thing.created == created
+        assert thing.changed >= created
+
+    def test_subclasses_inherit_the_listeners(self):
+        sub = self.SubThing(name="a")
+        self.session.add(sub)
+        self.session.flush()
+        assert sub.created is not None
+        assert sub.changed == sub.created
+
+    def test_timestamps_are_naive_utc(self):
+        thing = self.Thing(name="a")
+        self.session.add(thing)
+        self.session.flush()
+        assert thing.created.tzinfo is None
+        utc = datetime.now(timezone.utc).replace(tzinfo=None)
+        assert abs(utc - thing.created) < timedelta(minutes=1)
@@ -0,0 +1,117 @@
+"""Tests for the bag.sqlalchemy.json_col module."""
+
+import json
+from math import inf, isnan
+from unittest import TestCase
+
+from sqlalchemy import Column, Integer, text
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.dialects.postgresql import JSONB
+
+from bag.sqlalchemy.context import SAContext
+from bag.sqlalchemy.json_col import (
+    JSONEncodedDict,
+    MutableDict,
+    NativeJSONDict,
+    OrjsonEncodedDict,
+)
+
+
+class TestJSONColumn(TestCase):
+    """Tests for MutableDict over JSONEncodedDict."""
+
+    column_type = JSONEncodedDict
+
+    def setUp(self):
+        self.sa = SAContext()
+
+        class Thing(self.sa.base):
+            __tablename__ = "thing"
+            id = Column(Integer, primary_key=True)
+            data = Column(MutableDict.as_mutable(self.column_type))
+
+        self.Thing = Thing
+        self.sa.use_memory()
+        self.session = self.sa.Session()
+
+    def tearDown(self):
+        self.session.close()
+
+    def _reload(self, thing):
+        self.session.commit()
+        self.session.expire_all()
+        return self.session.get(self.Thing, thing.id)
+
+    def test_round_trip(self):
+        thing = self.Thing(data={"name": "José", "tags": [1, 2]})
+        self.session.add(thing)
+        thing = self._reload(thing)
+        assert thing.data == {"name": "José", "tags": [1, 2]}
+
+    def test_none_becomes_empty_dict(self):
+        thing = self.Thing(data=None)
+        self.session.add(thing)
+        assert self._reload(thing).data == {}
+
+    def test_mutation_is_persisted(self):
+        thing = self.Thing(data={"a": 1})
+        self.session.add(thing)
+        thing = self._reload(thing)
+        thing.data["b"] = 2
+        del thing.data["a"]
+        assert self._reload(thing).data == {"b": 2}
+
+    def test_bulk_mutations_are_persisted(self):
+        thing = self.Thing(data={"a": 1, "b": 2})
+        self.session.add(thing)
+        thing = self._reload(thing)
+        thing.data.update({"c": 3}, d=4)
+        assert self._reload(thing).data == {"a": 1, "b": 2, "c": 3, "d": 4}
+        thing.data.pop("a")
+        thing.data.setdefault("e", 5)
+        assert self._reload(thing).data == {"b": 2, "c": 3, "d": 4, "e": 5}
+        thing.data.clear()
+        assert self._reload(thing).data == {}
+
+    def test_big_ints_and_nan(self):
+        thing = self.Thing(data={"big": 2**70, "nan": float("nan"), "inf": inf})
+        self.session.add(thing)
+        data = self._reload(thing).data
+        assert data["big"] == 2**70
+        assert isnan(data["nan"])
+        assert data["inf"] == inf
+
+    def test_reads_what_the_stdlib_wrote(self):
+        stored = json.dumps({"nan": float("nan"), "big": 2**70})
+        self.session.execute(
+            text("INSERT INTO thing (id, data) VALUES (1, :data)"), {"data": stored}
+        )
+        data = self.session.get(self.Thing, 1).data
+        assert isnan(data["nan"])
+        assert data["big"] == 2**70
+
+
+class TestOrjsonColumn(TestJSONColumn):
+    """Tests for MutableDict over OrjsonEncodedDict."""
+
+    column_type = OrjsonEncodedDict
+
+    def test_big_ints_and_nan(self):
+        # orjson writes NaN as null, which is why this column is opt-in
+        thing = self.Thing(data={"big": 2**70})
+        self.session.add(thing)
+        assert self._reload(thing).data == {"big": 2**70}
+
+
+class TestNativeJSONColumn(TestJSONColumn):
+    """Tests for MutableDict over NativeJSONDict."""
+
+    column_type = NativeJSONDict
+
+    def test_dialect_impl(self):
+        typ = NativeJSONDict()
+        assert isinstance(typ.load_dialect_impl(postgresql.dialect()), JSONB)
+        assert not isinstance(typ.load_dialect_impl(sqlite.dialect()), JSONB)
+        pg = postgresql.dialect()
+        assert typ.process_bind_param({"a": 1}, pg) == {"a": 1}
+        assert typ.process_result_value(None, pg) == {}
@@ -0,0 +1,124 @@
+"""Tests for the bag.sqlalchemy.mediovaigel module."""
+
+from datetime import date, datetime
+from decimal import Decimal
+from io import StringIO
+from contextlib import redirect_stdout
+import os
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from sqlalchemy import (
+    Column, Date, DateTime, ForeignKey, Integer, Numeric, Table, Unicode, select)
+
+from bag.sqlalchemy.context import SAContext
+from bag.sqlalchemy.mediovaigel import Mediovaigel
+
+sa = SAContext()
+
+
+class Author(sa.base):
+    """A model for testing."""
+
+    __tablename__ = "author"
+    id = Column(Integer, primary_key=True)
+    name = Column(Unicode(40))
+    born = Column(Date)
+
+
+class Book(sa.base):
+    """A model for testing, which references Author."""
+
+    __tablename__ = "book"
+    id = Column(Integer, primary_key=True)
+    author_id = Column(Integer, ForeignKey("author.id"))
+    title = Column(Unicode(40))
+    price = Column(Numeric(8, 2))
+    published = Column(DateTime)
+
+
+book_fan = Table(
+    "book_fan", sa.metadata,
+    Column("book_id", Integer, ForeignKey("book.id"), nullable=False),
+    Column("fan_id", Integer, ForeignKey("author.id"), nullable=False),
+)
+
+
+class TestMediovaigel(TestCase):
+    """Generate fixtures from one database and load them on another."""
+
+    def setUp(self):
+        self.source = sa.clone("sqlite://").create_tables()
+        session = self.source.Session()
+        session.add_all([
+            Author(id=5, name="Ana", born=date(1970, 1, 2)),
+            Author(id=7, name="Bia", born=None),
+        ])
+        session.add_all([
+            Book(id=3, author_id=7, title="Título", price=Decimal("9.90"),
+                 published=datetime(2020, 5, 6, 7, 8, 9, 10)),
+            Book(id=4, author_id=5, title="Other", price=None, published=None),
+        ])
+        session.execute(book_fan.insert(), [
+            {"book_id": 3, "fan_id": 5}, {"book_id": 4, "fan_id": 7}])
+        session.commit()
+        self.session = session
+
+    def tearDown(self):
+        self.session.close()
+
+    def _generate(self, writer=None):
+        m = Mediovaigel(writer=writer)
+        m.generate_fixtures(Author, sas=self.session)
+        m.generate_fixtures(Book, sas=self.session)
+        m.generate_fixtures(
+            "tests.test_sqlalchemy_mediovaigel:book_fan", sas=self.session)
+        return m.output() if writer is None else None
+
+    def test_round_trip(self):
+        self._load(self._generate())
+
+    def test_round_trip_streaming(self):
+        writer = StringIO()
+        self._generate(writer=writer)
+        self._load(writer.getvalue())
+
+    def test_streaming_has_no_output(self):
+        m = Mediovaigel(writer=StringIO())
+        m.generate_fixtures(Author, sas=self.session)
+        with self.assertRaises(RuntimeError):
+            m.output()
+        with TemporaryDirectory() as directory:
+            path = os.path.join(directory, "fixtures.py")
+            with self.assertRaises(RuntimeError):
+                m.save_to(path)
+            assert not os.path.exists(path)
+
+    def test_imports_are_not_repeated(self):
+        for writer in (None, StringIO()):
+            m = Mediovaigel(writer=writer)
+            m.generate_fixtures(Author, sas=self.session)
+            m.generate_fixtures(
+                Author, query=self.session.query(Author).filter_by(id=5))
+            code = m.output() if writer is None else writer.getvalue()
+            assert code.count("import Author") == 1
+            compile(code, "fixtures", "exec")
+
+    def _load(self, code):
+        namespace = {}
+        exec(compile(code, "fixtures", "exec"), namespace)
+        target = sa.clone("sqlite://").create_tables()
+        session = target.Session()
+        with redirect_stdout(StringIO()):
+            namespace["load_fixtures"](session)
+        books = {b.title: b for b in session.query(Book)}
+        assert books["Título"].price == Decimal("9.90")
+        assert books["Título"].published == datetime(2020, 5, 6, 7, 8, 9, 10)
+        assert session.get(Author, books["Título"].author_id).name == "Bia"
+        assert session.get(Author, books["Other"].author_id).born == date(
+            1970, 1, 2)
+        fans = {(session.get(Book, book_id).title,
+                 session.get(Author, fan_id).name)
+                for book_id, fan_id in session.execute(select(book_fan))}
+        assert fans == {("Título", "Ana"), ("Other", "Bia")}
+        session.close()
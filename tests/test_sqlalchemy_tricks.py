@@ -5,10 +5,11 @@ TODO: Write more tests!
 
 from unittest import TestCase
 
-from sqlalchemy import Column
-from sqlalchemy.types import DateTime
+from sqlalchemy import Column, Table
+from sqlalchemy.types import DateTime, Integer
 
-from bag.sqlalchemy.tricks import ID, MinimalBase
+from bag.sqlalchemy.tricks import (
+    ID, MinimalBase, is_model_class, models_and_tables_in)
 
 
 class SomeModel(MinimalBase, ID):
@@ -23,3 +24,22 @@ class TestMinimalBase(TestCase):
     def test_tablename(self):
         model = SomeModel()
         assert model.__tablename__ == 'some_model'
+
+
+class TestModelsAndTablesIn(TestCase):
+    """Tests for the models_and_tables_in function."""
+
+    def test_models_and_tables_in(self):
+        from bag.sqlalchemy.context import SAContext
+        sa = SAContext()
+
+        class Thing(sa.base):
+            __tablename__ = 'thing'
+            id = Column(Integer, primary_key=True)
+
+        table = Table('other', sa.metadata, Column('id', Integer))
+        context = {'Thing': Thing, 'other': table, 'TestCase': TestCase,
+                   'n': 1, 'table_name': '__table__'}
+        assert is_model_class(Thing)
+        assert not is_model_class(Thing())
+        assert models_and_tables_in(context) == ([Thing], [table])
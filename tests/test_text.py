@@ -1,7 +1,8 @@
 """Tests the *text* module."""
 
 import unittest
-from bag.text import break_lines_near, to_filename
+from datetime import datetime
+from bag.text import break_lines_near, parse_iso_date, to_filename
 
 
 class TestText(unittest.TestCase):
@@ -11,6 +12,16 @@ class TestText(unittest.TestCase):
             to_filename("Carl Sagan", for_web=True, maxlength=16),
             'Carl-Sagan')
 
+    def test_parse_iso_date(self):
+        with self.assertWarns(DeprecationWarning):
+            self.assertEqual(
+                parse_iso_date("2020-01-02 03:04:05.678"),
+                datetime(2020, 1, 2, 3, 4, 5))
+        for txt in ("2020-01-02", "2020-01-02 03:04", "2020-01-02T03:04:05"):
+            with self.assertWarns(DeprecationWarning), \
+                    self.assertRaises(ValueError):
+                parse_iso_date(txt)
+
 
 class TestBreakLinesNear(unittest.TestCase):
     def test_works_like_this(self):